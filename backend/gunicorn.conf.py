@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration - production API server
+Run: gunicorn -c gunicorn.conf.py wsgi:application
+"""
+
+import multiprocessing
+import os
+
+# Set before the app loads so .env (FLASK_ENV=development) can't override it
+raw_env = ["FLASK_ENV=production"]
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gthread"
+threads = 4
+keepalive = 30
+
+# Build the app once in the master, then fork workers with routes already loaded
+preload_app = True
+
+errorlog = "-"
@@ -0,0 +1,72 @@
+"""
+Auth middleware - JWT verification cache
+Skips repeat HMAC signature checks for tokens seen in the last 30 seconds
+
+flask-jwt-extended has no public hook around signature verification, so the
+cache wraps JWTManager._decode_jwt_from_config; requirements.txt pins the
+versions it is known to work with. Only the decode is cached: blocklist,
+token-type and user-lookup checks still run on every request, so revoking a
+token through the blocklist is immediate. What can lag by up to
+TOKEN_CACHE_TTL seconds per worker is a JWT_SECRET_KEY rotation - a token
+signed with the old key stays accepted until its cache entry expires.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+TOKEN_CACHE_TTL = 30
+
+_cache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL)
+_lock = threading.Lock()
+
+
+def _token_key(token):
+    """Hash the raw token so the cache never holds bearer credentials"""
+    if isinstance(token, str):
+        token = token.encode()
+    return hashlib.sha256(token).hexdigest()[:32]
+
+
+def _verified_token(token, decode):
+    """Return decoded claims, only running the verifier on a cache miss"""
+    key = _token_key(token)
+    now = time.time()
+
+    with _lock:
+        entry = _cache.get(key)
+    if entry is not None and entry[1] > now:
+        return dict(entry[0])
+
+    # Raises on bad signature / expiry - failed decodes are never cached
+    decoded = decode(token)
+
+    # Never serve a cached token past its own expiry: TTL = min(30, exp - now)
+    exp = decoded.get("exp")
+    expires_at = now + TOKEN_CACHE_TTL if exp is None else min(now + TOKEN_CACHE_TTL, exp)
+    if expires_at > now:
+        with _lock:
+            _cache[key] = (decoded, expires_at)
+    return dict(decoded)
+
+
+def init_jwt_cache(jwt):
+    """Route flask-jwt-extended's token decoder through the TTL cache"""
+    decode = getattr(jwt, "_decode_jwt_from_config", None)
+    if decode is None:
+        # Fail at startup rather than silently running without verification caching
+        raise RuntimeError("flask-jwt-extended no longer exposes _decode_jwt_from_config; unset CACHE_JWT")
+
+    def cached_decode(encoded_token, csrf_value=None, allow_expired=False):
+        # CSRF-bound and allow_expired decodes always go to the verifier
+        if csrf_value is not None or allow_expired:
+            return decode(encoded_token, csrf_value, allow_expired)
+        return _verified_token(encoded_token, decode)
+
+    jwt._decode_jwt_from_config = cached_decode
+    logger.info("🔐 JWT verification cache enabled")
@@ -0,0 +1,79 @@
+"""
+Logging middleware - per-request SQL statement counter
+Flags requests that run more statements than their budget (N+1 tripwire)
+"""
+
+import logging
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERY_BUDGET = 5
+
+# Known hot endpoints and the statements they need; tenant_scoped routes
+# spend one on binding the RLS context
+ENDPOINT_QUERY_BUDGETS = {
+    "facilities.list_facilities": 2,
+    "billing.get_bill": 2,
+    "patients.list_patients": 3,  # patients + one batched bills query
+    "payments.export_payments": 1,  # rows stream later through a DBAPI named cursor
+    "health.stats": 1,
+}
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised instead of logging when QUERY_BUDGET_STRICT is on (tests)"""
+
+
+def parse_query_budgets(value):
+    """'billing.get_bill=3,health.stats=2' -> {endpoint: budget}"""
+    budgets = {}
+    for item in (value or "").split(","):
+        if item.strip():
+            endpoint, _, budget = item.partition("=")
+            budgets[endpoint.strip()] = int(budget)
+    return budgets
+
+
+def init_query_counter(app, db):
+    """Count statements per request and flag requests that exceed the budget
+
+    QUERY_BUDGET sets the default limit; QUERY_BUDGETS overrides
+    ENDPOINT_QUERY_BUDGETS per endpoint name. Over-budget requests are
+    logged, or raise QueryBudgetExceeded when QUERY_BUDGET_STRICT is set.
+    """
+    default_budget = app.config.get('QUERY_BUDGET', DEFAULT_QUERY_BUDGET)
+    budgets = {**ENDPOINT_QUERY_BUDGETS, **app.config.get('QUERY_BUDGETS', {})}
+    strict = app.config.get('QUERY_BUDGET_STRICT', False)
+
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_query(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            g.query_count = g.get("query_count", 0) + 1
+
+    @app.before_request
+    def _reset_query_count():
+        # g belongs to the app context, which an outer context (CLI, tests) may share
+        g.query_count = 0
+
+    @app.after_request
+    def _check_query_budget(response):
+        count = g.get("query_count", 0)
+        budget = budgets.get(request.endpoint, default_budget)
+        if count > budget:
+            if strict:
+                raise QueryBudgetExceeded(
+                    f"{request.endpoint} ran {count} statements (budget {budget})"
+                )
+            logger.warning("Query budget exceeded: route=%s count=%d budget=%d",
+                           request.endpoint, count, budget)
+        else:
+            logger.debug("route=%s count=%d", request.endpoint, count)
+        return response
+
+    logger.info("🔎 Per-request query counter enabled (budget %d)", default_budget)
@@ -4,22 +4,27 @@ PostgreSQL 16 + RLS + Partitioning + JSONB + Encryption
 """
 
 from datetime import datetime, date, time
-from decimal import Decimal
 from typing import Optional, Dict, Any, List
+import re
 import uuid
 from sqlalchemy import (
     Column, ForeignKey, String, Text, Boolean, DateTime, Date, Time,
     Numeric, BigInteger, Integer, Index, UniqueConstraint, CheckConstraint,
-    func, text
+    Computed, Identity, func, text, literal_column, select
 )
-from sqlalchemy.dialects.postgresql import UUID, BYTEA, ARRAY, JSONB, ENUM
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.dialects.postgresql import UUID, BYTEA, ARRAY, JSONB, ENUM, CITEXT
+from sqlalchemy.orm import relationship, declarative_base, raiseload
 from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy.ext.hybrid import hybrid_property
 from flask_sqlalchemy import SQLAlchemy
 import enum
 
-db = SQLAlchemy()
+# One declarative base shared with Flask-SQLAlchemy: a single metadata/engine,
+# db.create_all() sees every model and Model.query works
 Base = declarative_base()
+# Keep loaded attributes after commit - serializing right after a write
+# must not trigger a re-SELECT per instance
+db = SQLAlchemy(model_class=Base, session_options={"expire_on_commit": False})
 
 # =====================================================================
 # PYTHON ENUMS (matching PostgreSQL ENUMs)
@@ -84,18 +89,110 @@ class AuditAction(str, enum.Enum):
     UPDATE = "update"
     DELETE = "delete"
 
+
+def pg_enum(enum_cls, name):
+    """Native PG enum labelled by member values; rows load as plain str (no PyEnum coercion)"""
+    return ENUM(*[member.value for member in enum_cls], name=name, schema="app")
+
+
+# Every app.* enum type ever created from these classes. Databases built
+# before pg_enum() carry member NAMES ('HOSPITAL') as labels; the migration
+# below renames them in place to the values ('hospital') the models now use
+PG_ENUM_TYPES = {
+    "facility_type_enum": FacilityType,
+    "commission_type_enum": CommissionType,
+    "user_role_enum": UserRole,
+    "bill_status_enum": BillStatus,  # column is a CHECKed string now; type kept for old DBs
+    "payment_status_enum": PaymentStatus,  # likewise
+    "settlement_status_enum": SettlementStatus,
+    "settlement_type_enum": SettlementType,
+    "audit_action_enum": AuditAction,
+}
+
+_ENUM_RENAMES = ",\n            ".join(
+    f"('{type_name}', '{member.name}', '{member.value}')"
+    for type_name, enum_cls in PG_ENUM_TYPES.items()
+    for member in enum_cls
+    if member.name != member.value
+)
+
+# Idempotent: only labels still spelled as NAMES are renamed (no table rewrite)
+ENUM_LABELS_MIGRATION_SQL = f"""
+DO $$
+DECLARE r record;
+BEGIN
+    FOR r IN
+        SELECT v.type_name, v.old_label, v.new_label
+        FROM (VALUES
+            {_ENUM_RENAMES}
+        ) AS v(type_name, old_label, new_label)
+        JOIN pg_type t ON t.typname = v.type_name
+        JOIN pg_namespace n ON n.oid = t.typnamespace AND n.nspname = 'app'
+        JOIN pg_enum e ON e.enumtypid = t.oid AND e.enumlabel = v.old_label
+    LOOP
+        -- quote_*() rather than format(): its placeholders clash with the driver's
+        EXECUTE 'ALTER TYPE app.' || quote_ident(r.type_name)
+             || ' RENAME VALUE ' || quote_literal(r.old_label) || ' TO ' || quote_literal(r.new_label);
+    END LOOP;
+END
+$$;
+"""
+
+
+def enum_check(column, enum_cls, name):
+    """CHECK constraint restricting a String column to the enum's values"""
+    values = ", ".join(f"'{member.value}'" for member in enum_cls)
+    return CheckConstraint(f"{column} IN ({values})", name=name)
+
 # =====================================================================
 # BASE MIXINS
 # =====================================================================
 
 class TimestampMixin:
-    """Add created_at and updated_at columns"""
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    """Add created_at and updated_at columns (DB-filled, so COPY/Core inserts can omit them)"""
+    # statement_timestamp(): per-statement time, not frozen at transaction start
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.statement_timestamp())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.statement_timestamp(), onupdate=func.now())
+
+def paise_column(amount_column):
+    """Generated BIGINT copy of a Numeric(14, 2) rupee column, in paise
+
+    Always in sync (STORED generated column, no backfill job). SUM() over it
+    accumulates on PG's int8 fast path but still returns numeric, so cast the
+    total back - func.sum(col).cast(BigInteger) - to load a Python int.
+    """
+    return Column(BigInteger, Computed(f"({amount_column} * 100)::bigint", persisted=True), nullable=False)
+
+# Integer-looking JSON values only (at most 9 digits, so the cast can't overflow
+# int4); anything else reads as NULL instead of failing the INSERT
+JSON_INT_PATTERN = r"-?[0-9]{1,9}"
+
+def json_int_sql(jsonb_column, key):
+    """Guarded (jsonb ->> key)::int - one text for the index and its query expression"""
+    value = f"({jsonb_column} ->> '{key}')"
+    return f"(CASE WHEN {value} ~ '^{JSON_INT_PATTERN}$' THEN {value}::int END)"
+
+# Time-ordered UUIDv7 (RFC 9562): 48-bit ms timestamp + random bits, so new
+# rows land at the right edge of the PK B-tree instead of random pages.
+# Built from a v4 uuid (same variant bits) with the timestamp overlaid and
+# the version nibble flipped from 4 to 7.
+UUID_V7_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(uuid_send(gen_random_uuid())
+                        placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                        FROM 1 FOR 6),
+                52, 1),
+            53, 1),
+        'hex')::uuid
+$$ LANGUAGE sql VOLATILE;
+"""
 
 class UUIDPrimaryKey:
-    """UUID primary key with auto-generation"""
-    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
+    """UUID primary key with auto-generation (time-ordered v7)"""
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
 class TenantMixin:
     """Multi-tenant columns"""
@@ -117,15 +214,16 @@ class Tenant(Base, UUIDPrimaryKey, TimestampMixin):
 
     code = Column(String(100), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=False)
-    status = Column(String(20), nullable=False, default="active", index=True)
+    status = Column(String(20), nullable=False, server_default=text("'active'"), index=True)
 
     # Relationships
-    facilities = relationship("Facility", back_populates="tenant", cascade="all, delete-orphan", lazy="dynamic")
-    users = relationship("User", back_populates="tenant", lazy="dynamic")
+    # ON DELETE CASCADE in the FK does the work - no ORM load-and-delete of children
+    facilities = relationship("Facility", back_populates="tenant", passive_deletes=True, lazy="raise_on_sql")
+    users = relationship("User", back_populates="tenant", passive_deletes=True, lazy="dynamic")
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "id": str(self.id),
+            "id": self.id,
             "code": self.code,
             "name": self.name,
             "status": self.status,
@@ -136,29 +234,30 @@ class Facility(Base, UUIDPrimaryKey, TimestampMixin):
     __tablename__ = "facilities"
     __table_args__ = (
         Index("idx_facilities_tenant_type", "tenant_id", "facility_type"),
+        Index("idx_facilities_tenant_name", "tenant_id", "name", "id"),  # GET /api/facilities page
         Index("idx_facilities_status", "status"),
         {"schema": "app"}
     )
 
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("app.tenants.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
-    facility_type = Column(ENUM(FacilityType, name="facility_type_enum", schema="app"), nullable=False)
-    status = Column(String(20), nullable=False, default="onboarding")
+    facility_type = Column(pg_enum(FacilityType, "facility_type_enum"), nullable=False)
+    status = Column(String(20), nullable=False, server_default=text("'onboarding'"))
     
     # Online payment MDR config
-    pg_mdr_percent = Column(Numeric(6, 3), nullable=False, default=Decimal("0.000"))
-    pg_mdr_gst_percent = Column(Numeric(6, 3), nullable=False, default=Decimal("0.000"))
-    platform_mdr_percent = Column(Numeric(6, 3), nullable=False, default=Decimal("0.000"))
-    platform_mdr_gst_percent = Column(Numeric(6, 3), nullable=False, default=Decimal("0.000"))
+    pg_mdr_percent = Column(Numeric(6, 3), nullable=False, server_default=text("0.000"))
+    pg_mdr_gst_percent = Column(Numeric(6, 3), nullable=False, server_default=text("0.000"))
+    platform_mdr_percent = Column(Numeric(6, 3), nullable=False, server_default=text("0.000"))
+    platform_mdr_gst_percent = Column(Numeric(6, 3), nullable=False, server_default=text("0.000"))
     
     # Cash commission config
-    cash_commission_enabled = Column(Boolean, nullable=False, default=False)
-    cash_commission_type = Column(ENUM(CommissionType, name="commission_type_enum", schema="app"), nullable=False, default=CommissionType.PERCENTAGE)
-    cash_commission_rate = Column(Numeric(10, 4), nullable=False, default=Decimal("0.0000"))
+    cash_commission_enabled = Column(Boolean, nullable=False, server_default=text("false"))
+    cash_commission_type = Column(pg_enum(CommissionType, "commission_type_enum"), nullable=False, server_default=text("'percentage'"))
+    cash_commission_rate = Column(Numeric(10, 4), nullable=False, server_default=text("0.0000"))
     
     onboarded_at = Column(DateTime(timezone=True))
     created_by = Column(UUID(as_uuid=True))
-    extra_data = Column(JSONB, default=dict)  # ✅ RENAMED from metadata
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))  # ✅ RENAMED from metadata
 
     # Relationships
     tenant = relationship("Tenant", back_populates="facilities")
@@ -169,18 +268,18 @@ class Facility(Base, UUIDPrimaryKey, TimestampMixin):
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "id": str(self.id),
-            "tenant_id": str(self.tenant_id),
+            "id": self.id,
+            "tenant_id": self.tenant_id,
             "name": self.name,
-            "facility_type": self.facility_type.value,
+            "facility_type": self.facility_type,
             "status": self.status,
-            "pg_mdr_percent": float(self.pg_mdr_percent),
-            "pg_mdr_gst_percent": float(self.pg_mdr_gst_percent),
-            "platform_mdr_percent": float(self.platform_mdr_percent),
-            "platform_mdr_gst_percent": float(self.platform_mdr_gst_percent),
+            "pg_mdr_percent": self.pg_mdr_percent,
+            "pg_mdr_gst_percent": self.pg_mdr_gst_percent,
+            "platform_mdr_percent": self.platform_mdr_percent,
+            "platform_mdr_gst_percent": self.platform_mdr_gst_percent,
             "cash_commission_enabled": self.cash_commission_enabled,
-            "cash_commission_type": self.cash_commission_type.value,
-            "cash_commission_rate": float(self.cash_commission_rate),
+            "cash_commission_type": self.cash_commission_type,
+            "cash_commission_rate": self.cash_commission_rate,
             "onboarded_at": self.onboarded_at.isoformat() if self.onboarded_at else None,
         }
 
@@ -189,19 +288,21 @@ class User(Base, UUIDPrimaryKey, TimestampMixin):
     __table_args__ = (
         Index("idx_users_tenant_facility", "tenant_id", "facility_id"),
         Index("idx_users_role", "role"),
+        Index("idx_users_active", "facility_id", postgresql_where=text("is_active")),
         {"schema": "app"}
     )
 
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("app.tenants.id", ondelete="CASCADE"), nullable=True)
     facility_id = Column(UUID(as_uuid=True), ForeignKey("app.facilities.id", ondelete="SET NULL"))
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    # Case-insensitive equality and uniqueness in the DB - no lower() on either side
+    email = Column(CITEXT, unique=True, nullable=False, index=True)
     password_hash = Column(Text, nullable=False)
-    role = Column(ENUM(UserRole, name="user_role_enum", schema="app"), nullable=False)
-    is_active = Column(Boolean, nullable=False, default=True, index=True)
+    role = Column(pg_enum(UserRole, "user_role_enum"), nullable=False)
+    is_active = Column(Boolean, nullable=False, server_default=text("true"))
     
     full_name = Column(String(255))
     phone = Column(String(20))
-    extra_data = Column(JSONB, default=dict)  # ✅ RENAMED from metadata
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))  # ✅ RENAMED from metadata
 
     # Relationships
     tenant = relationship("Tenant", back_populates="users")
@@ -210,11 +311,11 @@ class User(Base, UUIDPrimaryKey, TimestampMixin):
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "id": str(self.id),
-            "tenant_id": str(self.tenant_id) if self.tenant_id else None,
-            "facility_id": str(self.facility_id) if self.facility_id else None,
+            "id": self.id,
+            "tenant_id": self.tenant_id,
+            "facility_id": self.facility_id,
             "email": self.email,
-            "role": self.role.value,
+            "role": self.role,
             "is_active": self.is_active,
             "full_name": self.full_name,
             "phone": self.phone,
@@ -240,20 +341,21 @@ class Patient(Base, UUIDPrimaryKey, TimestampMixin):
     address = Column(Text)
     emergency_contact = Column(String(255))
     blood_group = Column(String(5))
-    extra_data = Column(JSONB, default=dict)  # ✅ RENAMED from metadata
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))  # ✅ RENAMED from metadata
 
     # Relationships
     facility = relationship("Facility", back_populates="patients")
-    user = relationship("User", back_populates="patients")
-    health_cards = relationship("HealthCard", back_populates="patient", lazy="dynamic")
-    bills = relationship("Bill", back_populates="patient", lazy="dynamic")
+    user = relationship("User", back_populates="patients", lazy="joined")
+    # Collections never lazy-load: callers opt in with selectinload(), so an N+1 fails loudly
+    health_cards = relationship("HealthCard", back_populates="patient", lazy="raise_on_sql")
+    bills = relationship("Bill", back_populates="patient", lazy="raise_on_sql")
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "id": str(self.id),
-            "tenant_id": str(self.tenant_id),
-            "facility_id": str(self.facility_id),
-            "user_id": str(self.user_id) if self.user_id else None,
+            "id": self.id,
+            "tenant_id": self.tenant_id,
+            "facility_id": self.facility_id,
+            "user_id": self.user_id,
             "full_name": self.full_name,
             "gender": self.gender,
             "dob": self.dob.isoformat() if self.dob else None,
@@ -266,7 +368,11 @@ class HealthCard(Base, UUIDPrimaryKey, TimestampMixin):
     __tablename__ = "health_cards"
     __table_args__ = (
         Index("idx_health_cards_patient", "patient_id"),
-        Index("idx_health_cards_profile_gin", "medical_profile", postgresql_using="gin"),
+        # Constraint only: verify_pin compares the digest in Python after the card_number lookup
+        Index("uq_health_cards_pin_hmac", "pin_hmac", unique=True),
+        CheckConstraint("octet_length(pin_hmac) = 32", name="ck_health_cards_pin_hmac_len"),
+        Index("idx_health_cards_profile_gin", "medical_profile", postgresql_using="gin",
+              postgresql_ops={"medical_profile": "jsonb_path_ops"}),
         {"schema": "app"}
     )
 
@@ -276,15 +382,17 @@ class HealthCard(Base, UUIDPrimaryKey, TimestampMixin):
     
     card_number = Column(String(100), unique=True, nullable=False, index=True)
     pin_encrypted = Column(BYTEA, nullable=False)
-    medical_profile = Column(JSONB, nullable=False, default=dict)
+    # HMAC-SHA256(card_number || pin), see utils.encryption.pin_hmac
+    pin_hmac = Column(BYTEA, nullable=False)
+    medical_profile = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
 
     # Relationships
     patient = relationship("Patient", back_populates="health_cards")
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "id": str(self.id),
-            "patient_id": str(self.patient_id),
+            "id": self.id,
+            "patient_id": self.patient_id,
             "card_number": self.card_number,
             "medical_profile": self.medical_profile,
         }
@@ -293,6 +401,9 @@ class Service(Base, UUIDPrimaryKey, TimestampMixin):
     __tablename__ = "services"
     __table_args__ = (
         Index("idx_services_tenant_facility", "tenant_id", "facility_id"),
+        Index("idx_services_extra_priority", text(json_int_sql("extra_data", "priority"))),
+        # Partial index: only active rows, matching "active services for facility"
+        Index("idx_services_active", "facility_id", postgresql_where=text("is_active")),
         UniqueConstraint("facility_id", "code", name="uq_service_facility_code"),
         {"schema": "app"}
     )
@@ -304,20 +415,32 @@ class Service(Base, UUIDPrimaryKey, TimestampMixin):
     name = Column(String(255), nullable=False)
     category = Column(String(100))
     description = Column(Text)
-    base_price = Column(Numeric(12, 2), nullable=False, default=Decimal("0"))
-    is_active = Column(Boolean, nullable=False, default=True, index=True)
-    extra_data = Column(JSONB, default=dict)  # ✅ RENAMED from metadata
+    base_price = Column(Numeric(12, 2), nullable=False, server_default=text("0"))
+    is_active = Column(Boolean, nullable=False, server_default=text("true"))
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))  # ✅ RENAMED from metadata
 
     # Relationships
     facility = relationship("Facility", back_populates="services")
 
+    @hybrid_property
+    def priority(self) -> Optional[int]:
+        value = (self.extra_data or {}).get("priority")
+        if value is None or isinstance(value, bool):
+            return None
+        return int(value) if re.fullmatch(JSON_INT_PATTERN, str(value)) else None
+
+    @priority.expression
+    def priority(cls):
+        # Must match idx_services_extra_priority exactly for the planner to use it
+        return literal_column(json_int_sql("app.services.extra_data", "priority"), Integer).label("priority")
+
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "id": str(self.id),
+            "id": self.id,
             "code": self.code,
             "name": self.name,
             "category": self.category,
-            "base_price": float(self.base_price),
+            "base_price": self.base_price,
             "is_active": self.is_active,
         }
 
@@ -326,6 +449,7 @@ class Staff(Base, UUIDPrimaryKey, TimestampMixin):
     __table_args__ = (
         Index("idx_staff_tenant_facility", "tenant_id", "facility_id"),
         Index("idx_staff_role", "role"),
+        Index("idx_staff_active", "facility_id", postgresql_where=text("is_active")),
         {"schema": "app"}
     )
 
@@ -338,15 +462,15 @@ class Staff(Base, UUIDPrimaryKey, TimestampMixin):
     specialties = Column(ARRAY(String))
     qualification = Column(String(255))
     license_number = Column(String(100))
-    is_active = Column(Boolean, nullable=False, default=True, index=True)
-    extra_data = Column(JSONB, default=dict)  # ✅ RENAMED from metadata
+    is_active = Column(Boolean, nullable=False, server_default=text("true"))
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))  # ✅ RENAMED from metadata
 
     # Relationships
     facility = relationship("Facility", back_populates="staff")
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "id": str(self.id),
+            "id": self.id,
             "full_name": self.full_name,
             "role": self.role,
             "specialties": self.specialties,
@@ -360,46 +484,63 @@ class Staff(Base, UUIDPrimaryKey, TimestampMixin):
 class Bill(Base, TimestampMixin):
     __tablename__ = "bills"
     __table_args__ = (
-        Index("idx_bills_tenant_facility", "tenant_id", "facility_id"),
+        # Covers the tenant/facility bill listing so it can run as an index-only scan
+        Index("idx_bills_list", "tenant_id", "facility_id", "status", "appointment_date",
+              postgresql_include=["bill_number", "total_amount"]),
         Index("idx_bills_patient", "patient_id"),
         Index("idx_bills_status", "status"),
+        # Hot status columns are plain strings; the value domain is enforced here
+        enum_check("status", BillStatus, "ck_bills_status"),
+        # Unique lookup by bill number answered from the index alone (index-only scan)
+        Index("idx_bills_number_covering", "bill_number", unique=True,
+              postgresql_include=["total_amount", "status", "patient_id", "facility_id"]),
+        Index("idx_bills_extra_tags_gin", literal_column("(extra_data -> 'tags')").label("tags"),
+              postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
         {"schema": "billing"}
     )
 
-    id = Column(BigInteger, primary_key=True)
+    # Server-generated values come back in the INSERT's RETURNING, and batched
+    # inserts use the multi-row insertmanyvalues path
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(BigInteger, Identity(), primary_key=True)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
     facility_id = Column(UUID(as_uuid=True), nullable=False)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("app.patients.id", ondelete="CASCADE"), nullable=False)
     appointment_id = Column(BigInteger)
     appointment_date = Column(Date)
     
-    bill_number = Column(String(100), unique=True, nullable=False, index=True)
-    subtotal_amount = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
-    discount_amount = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
-    tax_amount = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
-    total_amount = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
-    status = Column(ENUM(BillStatus, name="bill_status_enum", schema="app"), nullable=False, default=BillStatus.DRAFT)
-    currency = Column(String(3), nullable=False, default="INR")
+    bill_number = Column(String(100), nullable=False)
+    subtotal_amount = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
+    discount_amount = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
+    tax_amount = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
+    total_amount = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
+    subtotal_paise = paise_column("subtotal_amount")
+    discount_paise = paise_column("discount_amount")
+    tax_paise = paise_column("tax_amount")
+    total_paise = paise_column("total_amount")
+    status = Column(String(20), nullable=False, server_default=text("'draft'"))
+    currency = Column(String(3), nullable=False, server_default=text("'INR'"))
     
     notes = Column(Text)
-    extra_data = Column(JSONB, default=dict)  # ✅ RENAMED from metadata
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))  # ✅ RENAMED from metadata
 
-    # Relationships
+    # Relationships (children only load when the query asks: selectinload(Bill.items) etc.)
     patient = relationship("Patient", back_populates="bills")
-    items = relationship("BillItem", back_populates="bill", cascade="all, delete-orphan", lazy="dynamic")
-    payments = relationship("Payment", back_populates="bill", lazy="dynamic")
-    cash_collections = relationship("CashCollection", back_populates="bill", lazy="dynamic")
+    items = relationship("BillItem", back_populates="bill", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    payments = relationship("Payment", back_populates="bill", passive_deletes=True, lazy="raise_on_sql")
+    cash_collections = relationship("CashCollection", back_populates="bill", passive_deletes=True, lazy="raise_on_sql")
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "bill_number": self.bill_number,
-            "patient_id": str(self.patient_id),
-            "subtotal_amount": float(self.subtotal_amount),
-            "discount_amount": float(self.discount_amount),
-            "tax_amount": float(self.tax_amount),
-            "total_amount": float(self.total_amount),
-            "status": self.status.value,
+            "patient_id": self.patient_id,
+            "subtotal_amount": self.subtotal_amount,
+            "discount_amount": self.discount_amount,
+            "tax_amount": self.tax_amount,
+            "total_amount": self.total_amount,
+            "status": self.status,
             "currency": self.currency,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
@@ -411,15 +552,17 @@ class BillItem(Base):
         {"schema": "billing"}
     )
 
-    id = Column(BigInteger, primary_key=True)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(BigInteger, Identity(), primary_key=True)
     bill_id = Column(BigInteger, ForeignKey("billing.bills.id", ondelete="CASCADE"), nullable=False)
     service_id = Column(UUID(as_uuid=True))
     
     description = Column(String(500), nullable=False)
-    quantity = Column(Numeric(12, 2), nullable=False, default=Decimal("1"))
-    unit_price = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
-    line_total = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
-    extra_data = Column(JSONB, default=dict)  # ✅ RENAMED from metadata
+    quantity = Column(Numeric(12, 2), nullable=False, server_default=text("1"))
+    unit_price = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
+    line_total = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))  # ✅ RENAMED from metadata
 
     # Relationships
     bill = relationship("Bill", back_populates="items")
@@ -428,22 +571,30 @@ class BillItem(Base):
         return {
             "id": self.id,
             "description": self.description,
-            "quantity": float(self.quantity),
-            "unit_price": float(self.unit_price),
-            "line_total": float(self.line_total),
+            "quantity": self.quantity,
+            "unit_price": self.unit_price,
+            "line_total": self.line_total,
         }
 
 class Payment(Base, TimestampMixin):
     __tablename__ = "payments"
     __table_args__ = (
-        Index("idx_payments_tenant_facility", "tenant_id", "facility_id"),
+        Index("idx_payments_list", "tenant_id", "facility_id", "status",
+              postgresql_include=["amount", "gateway_transaction_id"]),
         Index("idx_payments_bill", "bill_id"),
         Index("idx_payments_status", "status"),
-        UniqueConstraint("gateway", "gateway_transaction_id", name="uq_payment_gateway_txn"),
+        enum_check("status", PaymentStatus, "ck_payments_status"),
+        Index("idx_payments_tenant_created", "tenant_id", "created_at"),
+        Index("uq_payment_gateway_txn", "gateway", "gateway_transaction_id", unique=True,
+              postgresql_include=["amount", "status", "bill_id"]),
+        Index("idx_payments_extra_gateway_meta_gin", literal_column("(extra_data -> 'gateway_meta')").label("gateway_meta"),
+              postgresql_using="gin", postgresql_ops={"gateway_meta": "jsonb_path_ops"}),
         {"schema": "billing"}
     )
 
-    id = Column(BigInteger, primary_key=True)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(BigInteger, Identity(), primary_key=True)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
     facility_id = Column(UUID(as_uuid=True), nullable=False)
     bill_id = Column(BigInteger, ForeignKey("billing.bills.id", ondelete="CASCADE"), nullable=False)
@@ -452,8 +603,9 @@ class Payment(Base, TimestampMixin):
     gateway = Column(String(50), nullable=False)
     gateway_transaction_id = Column(String(200), nullable=False)
     amount = Column(Numeric(14, 2), nullable=False)
-    currency = Column(String(3), nullable=False, default="INR")
-    status = Column(ENUM(PaymentStatus, name="payment_status_enum", schema="app"), nullable=False)
+    amount_paise = paise_column("amount")
+    currency = Column(String(3), nullable=False, server_default=text("'INR'"))
+    status = Column(String(20), nullable=False)
     
     # MDR & Commission fields
     mdr_percent = Column(Numeric(6, 3), nullable=False)
@@ -466,10 +618,11 @@ class Payment(Base, TimestampMixin):
     platform_mdr_gst_amount = Column(Numeric(14, 2), nullable=False)
     platform_commission_amount = Column(Numeric(14, 2), nullable=False)
     net_settlement_to_facility = Column(Numeric(14, 2), nullable=False)
+    net_settlement_paise = paise_column("net_settlement_to_facility")
     
     settled_in_settlement_id = Column(BigInteger)
     payment_method = Column(String(50))
-    extra_data = Column(JSONB, default=dict)  # ✅ RENAMED from metadata
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))  # ✅ RENAMED from metadata
 
     # Relationships
     bill = relationship("Bill", back_populates="payments")
@@ -479,10 +632,10 @@ class Payment(Base, TimestampMixin):
             "id": self.id,
             "gateway": self.gateway,
             "gateway_transaction_id": self.gateway_transaction_id,
-            "amount": float(self.amount),
-            "status": self.status.value,
-            "platform_commission_amount": float(self.platform_commission_amount),
-            "net_settlement_to_facility": float(self.net_settlement_to_facility),
+            "amount": self.amount,
+            "status": self.status,
+            "platform_commission_amount": self.platform_commission_amount,
+            "net_settlement_to_facility": self.net_settlement_to_facility,
         }
 
 class CashCollection(Base, TimestampMixin):
@@ -491,6 +644,13 @@ class CashCollection(Base, TimestampMixin):
         Index("idx_cash_collections_tenant_facility", "tenant_id", "facility_id"),
         Index("idx_cash_collections_bill", "bill_id"),
         Index("idx_cash_collections_status", "settlement_status"),
+        enum_check("settlement_status", SettlementStatus, "ck_cash_collections_settlement_status"),
+        # Only the unsettled backlog - what the settlement run scans
+        Index("idx_cash_collections_unsettled", "facility_id", "collection_timestamp",
+              postgresql_where=text("settlement_status = 'pending'")),
+        # Append-only, time-ordered: BRIN block ranges instead of a full B-tree
+        Index("idx_cash_collections_time_brin", "collection_timestamp",
+              postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
         {"schema": "billing"}
     )
 
@@ -502,16 +662,18 @@ class CashCollection(Base, TimestampMixin):
     collected_by_user_id = Column(UUID(as_uuid=True))
     
     amount_collected = Column(Numeric(14, 2), nullable=False)
-    collection_timestamp = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    amount_collected_paise = paise_column("amount_collected")
+    collection_timestamp = Column(DateTime(timezone=True), nullable=False, server_default=func.statement_timestamp())
     
-    commission_applicable = Column(Boolean, nullable=False, default=True)
-    commission_type = Column(ENUM(CommissionType, name="commission_type_enum", schema="app"), nullable=False)
+    commission_applicable = Column(Boolean, nullable=False, server_default=text("true"))
+    commission_type = Column(pg_enum(CommissionType, "commission_type_enum"), nullable=False)
     commission_rate = Column(Numeric(10, 4), nullable=False)
-    commission_amount = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
+    commission_amount = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
+    commission_paise = paise_column("commission_amount")
     
-    settlement_status = Column(ENUM(SettlementStatus, name="settlement_status_enum", schema="app"), nullable=False, default=SettlementStatus.PENDING)
+    settlement_status = Column(String(20), nullable=False, server_default=text("'pending'"))
     settled_in_settlement_id = Column(BigInteger)
-    extra_data = Column(JSONB, default=dict)  # ✅ RENAMED from metadata
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))  # ✅ RENAMED from metadata
 
     # Relationships
     bill = relationship("Bill", back_populates="cash_collections")
@@ -519,9 +681,9 @@ class CashCollection(Base, TimestampMixin):
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
-            "amount_collected": float(self.amount_collected),
-            "commission_amount": float(self.commission_amount),
-            "settlement_status": self.settlement_status.value,
+            "amount_collected": self.amount_collected,
+            "commission_amount": self.commission_amount,
+            "settlement_status": self.settlement_status,
             "collection_timestamp": self.collection_timestamp.isoformat() if self.collection_timestamp else None,
         }
 
@@ -542,16 +704,17 @@ class FacilitySettlement(Base, TimestampMixin):
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
     facility_id = Column(UUID(as_uuid=True), nullable=False)
     
-    settlement_type = Column(ENUM(SettlementType, name="settlement_type_enum", schema="app"), nullable=False)
+    settlement_type = Column(pg_enum(SettlementType, "settlement_type_enum"), nullable=False)
     from_date = Column(Date, nullable=False)
     to_date = Column(Date, nullable=False)
     
-    total_collections_amount = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
-    total_commission_amount = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
-    hospital_share_amount = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
-    platform_share_amount = Column(Numeric(14, 2), nullable=False, default=Decimal("0"))
+    # Derived totals - maintained by SETTLEMENT_TOTALS_TRIGGER_SQL, never written by the app
+    total_collections_amount = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
+    total_commission_amount = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
+    hospital_share_amount = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
+    platform_share_amount = Column(Numeric(14, 2), nullable=False, server_default=text("0"))
     
-    settlement_status = Column(ENUM(SettlementStatus, name="settlement_status_enum", schema="app"), nullable=False, default=SettlementStatus.DRAFT)
+    settlement_status = Column(pg_enum(SettlementStatus, "settlement_status_enum"), nullable=False, server_default=text("'draft'"))
     
     created_by_user_id = Column(UUID(as_uuid=True))
     approved_by_user_id = Column(UUID(as_uuid=True))
@@ -561,20 +724,20 @@ class FacilitySettlement(Base, TimestampMixin):
     paid_at = Column(DateTime(timezone=True))
     
     notes = Column(Text)
-    extra_data = Column(JSONB, default=dict)  # ✅ RENAMED from metadata
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))  # ✅ RENAMED from metadata
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
-            "facility_id": str(self.facility_id),
-            "settlement_type": self.settlement_type.value,
+            "facility_id": self.facility_id,
+            "settlement_type": self.settlement_type,
             "from_date": self.from_date.isoformat() if self.from_date else None,
             "to_date": self.to_date.isoformat() if self.to_date else None,
-            "total_collections_amount": float(self.total_collections_amount),
-            "total_commission_amount": float(self.total_commission_amount),
-            "hospital_share_amount": float(self.hospital_share_amount),
-            "platform_share_amount": float(self.platform_share_amount),
-            "settlement_status": self.settlement_status.value,
+            "total_collections_amount": self.total_collections_amount,
+            "total_commission_amount": self.total_commission_amount,
+            "hospital_share_amount": self.hospital_share_amount,
+            "platform_share_amount": self.platform_share_amount,
+            "settlement_status": self.settlement_status,
         }
 
 class SettlementPayment(Base):
@@ -591,6 +754,76 @@ class SettlementCashCollection(Base):
     settlement_id = Column(BigInteger, ForeignKey("settlement.facility_settlements.id", ondelete="CASCADE"), primary_key=True)
     cash_collection_id = Column(BigInteger, ForeignKey("billing.cash_collections.id", ondelete="CASCADE"), primary_key=True)
 
+# Keeps FacilitySettlement totals authoritative: whenever payments or cash
+# collections are linked/unlinked, the touched settlements are re-aggregated
+# once per statement (transition tables), so dashboards read one row.
+#   hospital share = online net_settlement_to_facility + cash minus commission
+#   platform share = platform commission (online + cash) = total commission
+# Gateway MDR/GST is in neither share: collected - hospital - platform = fees.
+# Parent rows are locked first (in id order, so concurrent linkers queue
+# instead of deadlocking); the aggregate is a new statement and therefore a
+# new READ COMMITTED snapshot that includes whatever the lock waited for.
+SETTLEMENT_TOTALS_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION settlement.refresh_settlement_totals() RETURNS trigger AS $$
+BEGIN
+    PERFORM 1 FROM settlement.facility_settlements
+    WHERE id IN (SELECT settlement_id FROM changed)
+    ORDER BY id
+    FOR UPDATE;
+
+    WITH touched AS (
+        SELECT DISTINCT settlement_id FROM changed
+    ), online AS (
+        SELECT sp.settlement_id,
+               sum(p.amount) AS collected,
+               sum(p.platform_commission_amount) AS commission,
+               sum(p.net_settlement_to_facility) AS hospital
+        FROM settlement.settlement_payments sp
+        JOIN billing.payments p ON p.id = sp.payment_id
+        WHERE sp.settlement_id IN (SELECT settlement_id FROM touched)
+        GROUP BY sp.settlement_id
+    ), cash AS (
+        SELECT sc.settlement_id,
+               sum(c.amount_collected) AS collected,
+               sum(c.commission_amount) AS commission
+        FROM settlement.settlement_cash_collections sc
+        JOIN billing.cash_collections c ON c.id = sc.cash_collection_id
+        WHERE sc.settlement_id IN (SELECT settlement_id FROM touched)
+        GROUP BY sc.settlement_id
+    ), totals AS (
+        SELECT t.settlement_id,
+               COALESCE(o.collected, 0) + COALESCE(c.collected, 0) AS collected,
+               COALESCE(o.commission, 0) + COALESCE(c.commission, 0) AS commission,
+               COALESCE(o.hospital, 0) + COALESCE(c.collected, 0) - COALESCE(c.commission, 0) AS hospital
+        FROM touched t
+        LEFT JOIN online o ON o.settlement_id = t.settlement_id
+        LEFT JOIN cash c ON c.settlement_id = t.settlement_id
+    )
+    UPDATE settlement.facility_settlements s
+    SET total_collections_amount = totals.collected,
+        total_commission_amount = totals.commission,
+        hospital_share_amount = totals.hospital,
+        platform_share_amount = totals.commission
+    FROM totals
+    WHERE s.id = totals.settlement_id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER settlement_payments_added
+    AFTER INSERT ON settlement.settlement_payments REFERENCING NEW TABLE AS changed
+    FOR EACH STATEMENT EXECUTE FUNCTION settlement.refresh_settlement_totals();
+CREATE OR REPLACE TRIGGER settlement_payments_removed
+    AFTER DELETE ON settlement.settlement_payments REFERENCING OLD TABLE AS changed
+    FOR EACH STATEMENT EXECUTE FUNCTION settlement.refresh_settlement_totals();
+CREATE OR REPLACE TRIGGER settlement_cash_collections_added
+    AFTER INSERT ON settlement.settlement_cash_collections REFERENCING NEW TABLE AS changed
+    FOR EACH STATEMENT EXECUTE FUNCTION settlement.refresh_settlement_totals();
+CREATE OR REPLACE TRIGGER settlement_cash_collections_removed
+    AFTER DELETE ON settlement.settlement_cash_collections REFERENCING OLD TABLE AS changed
+    FOR EACH STATEMENT EXECUTE FUNCTION settlement.refresh_settlement_totals();
+"""
+
 # =====================================================================
 # AUDIT SCHEMA MODELS
 # =====================================================================
@@ -600,19 +833,26 @@ class AuditLog(Base):
     __table_args__ = (
         Index("idx_audit_log_table", "table_name"),
         Index("idx_audit_log_tenant", "tenant_id", "facility_id"),
-        {"schema": "audit"}
+        Index("idx_audit_log_time_brin", "performed_at",
+              postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        # Containment lookups on audit diffs: new_data @> '{"status": "captured"}'
+        Index("idx_audit_log_new_data_gin", "new_data", postgresql_using="gin",
+              postgresql_ops={"new_data": "jsonb_path_ops"}),
+        # Monthly range partitions, see create_audit_partitions()
+        {"schema": "audit", "postgresql_partition_by": "RANGE (performed_at)"}
     )
 
-    id = Column(BigInteger, primary_key=True)
+    # The partition key must be part of the primary key
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     tenant_id = Column(UUID(as_uuid=True))
     facility_id = Column(UUID(as_uuid=True))
     table_name = Column(String(100), nullable=False)
     record_id = Column(String(200), nullable=False)
-    action = Column(ENUM(AuditAction, name="audit_action_enum", schema="app"), nullable=False)
+    action = Column(pg_enum(AuditAction, "audit_action_enum"), nullable=False)
     old_data = Column(JSONB)
     new_data = Column(JSONB)
     performed_by = Column(UUID(as_uuid=True))
-    performed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    performed_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.statement_timestamp())
 
 # =====================================================================
 # HELPER FUNCTIONS
@@ -631,6 +871,116 @@ def init_db(app):
         db.session.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";'))
         db.session.execute(text('CREATE EXTENSION IF NOT EXISTS "pgcrypto";'))
         db.session.execute(text('CREATE EXTENSION IF NOT EXISTS "pg_trgm";'))
+        db.session.execute(text('CREATE EXTENSION IF NOT EXISTS "citext";'))
+        db.session.connection().exec_driver_sql(UUID_V7_FUNCTION_SQL)
+        db.session.connection().exec_driver_sql(ENUM_LABELS_MIGRATION_SQL)
         
         db.session.commit()
         db.create_all()
+        db.session.connection().exec_driver_sql(SETTLEMENT_TOTALS_TRIGGER_SQL)
+        # audit_log is partitioned: without partitions every insert fails
+        create_audit_partitions(db.session)
+
+def _month_start(day, offset=0):
+    """First day of the month `offset` months after `day`"""
+    month = day.month - 1 + offset
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+def create_audit_partitions(session, months_ahead=2, today=None):
+    """Create audit.audit_log_YYYYMM partitions from this month through `months_ahead`
+
+    Idempotent - run it from cron (flask create-audit-partitions) so the next
+    month's partition always exists before the first insert lands in it.
+    """
+    today = today or date.today()
+    # Catch-all so an insert never fails for lack of a partition; it stays
+    # empty as long as months are created ahead (a month whose rows already
+    # sit here cannot be attached until they are moved out)
+    session.execute(text(
+        "CREATE TABLE IF NOT EXISTS audit.audit_log_default PARTITION OF audit.audit_log DEFAULT"
+    ))
+    created = []
+    for offset in range(months_ahead + 1):
+        start, end = _month_start(today, offset), _month_start(today, offset + 1)
+        name = f"audit_log_{start:%Y%m}"
+        session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS audit.{name} PARTITION OF audit.audit_log "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        created.append(name)
+    session.commit()
+    return created
+
+# Tenants holding at least this share of bills get their own partial index
+TENANT_INDEX_MIN_FREQ = 0.05
+
+TOP_BILL_TENANTS_SQL = text("""
+    SELECT v.tenant_id, v.freq
+    FROM pg_stats s,
+         unnest(s.most_common_vals::text::uuid[], s.most_common_freqs) AS v(tenant_id, freq)
+    WHERE s.schemaname = 'billing' AND s.tablename = 'bills' AND s.attname = 'tenant_id'
+      AND v.freq >= :min_freq
+    ORDER BY v.freq DESC
+    LIMIT :limit
+""")
+
+def create_tenant_bill_indexes(engine, limit=5, min_freq=TENANT_INDEX_MIN_FREQ):
+    """Build (facility_id, status) partial indexes on billing.bills for the biggest tenants
+
+    Tenant skew comes from the planner's own statistics (pg_stats MCVs, so
+    ANALYZE must have run) - no COUNT(*) over the table. Indexes are built
+    CONCURRENTLY, so this is safe to run from a maintenance job.
+
+    The planner only picks a partial index when it can prove the predicate
+    at plan time, i.e. with the tenant value known while planning. A literal
+    always works; the RLS current_setting() filter never does. A bound
+    parameter works only in a custom plan, and with psycopg's
+    prepare_threshold=5 a hot statement becomes a server-side prepared
+    statement whose generic plan cannot match tenant_id = '<uuid>'. Queries
+    meant to hit these indexes must inline the tenant id or run
+    SET LOCAL plan_cache_mode = force_custom_plan in their transaction.
+    """
+    created = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        rows = conn.execute(TOP_BILL_TENANTS_SQL, {"min_freq": min_freq, "limit": limit}).all()
+        for tenant_id, _freq in rows:
+            tenant_id = uuid.UUID(str(tenant_id))
+            name = f"idx_bills_tenant_{tenant_id.hex[-12:]}"
+            conn.exec_driver_sql(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON billing.bills (facility_id, status) WHERE tenant_id = '{tenant_id}'"
+            )
+            created.append(name)
+    return created
+
+def list_query(model, *loaders):
+    """SELECT for list endpoints: only the given loaders run, any other lazy load raises
+
+    e.g. list_query(Bill, selectinload(Bill.items), selectinload(Bill.patient))
+    turns an accidental per-row relationship access in to_dict() into an error
+    instead of a silent N+1.
+    """
+    return select(model).options(*loaders, raiseload("*"))
+
+# =====================================================================
+# RLS SESSION CONTEXT
+# =====================================================================
+
+# Constant statement text with bound values: no string building, no
+# injection surface, and psycopg can prepare it server-side. is_local=true
+# (SET LOCAL) scopes both values to the current transaction, so nothing
+# survives COMMIT/ROLLBACK onto a pooled (or PgBouncer-shared) connection.
+SET_RLS_CONTEXT_SQL = text(
+    "SELECT set_config('app.current_tenant', :tenant_id, true), "
+    "set_config('app.current_user', :user_id, true)"
+)
+
+def set_rls_context(session, tenant_id, user_id):
+    """Bind tenant/user for RLS policies for the session's current transaction (one round-trip)
+
+    Call it at the start of every transaction that touches RLS-protected tables.
+    """
+    session.execute(SET_RLS_CONTEXT_SQL, {
+        "tenant_id": str(tenant_id) if tenant_id else "",
+        "user_id": str(user_id) if user_id else "",
+    })
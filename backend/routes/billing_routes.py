@@ -0,0 +1,97 @@
+"""
+Billing routes
+GET /api/billing/bills/<id> - Bill with items and payments
+"""
+
+from flask import Blueprint, current_app, jsonify
+from sqlalchemy import text
+from models import db, UserRole
+from services.auth_service import FACILITY_SCOPED_ROLES, current_identity
+from utils.decorators import tenant_scoped
+from utils.responses import NOT_FOUND_BODY, static_response
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Create blueprint
+billing_bp = Blueprint('billing', __name__, url_prefix='/api/billing')
+
+# Whole bill document (same fields as Bill/BillItem/Payment.to_dict) built in
+# one query - numerics keep their exact scale, nothing is hydrated in Python
+GET_BILL_SQL = text("""
+    SELECT json_build_object(
+        'id', b.id,
+        'bill_number', b.bill_number,
+        'patient_id', b.patient_id,
+        'subtotal_amount', b.subtotal_amount,
+        'discount_amount', b.discount_amount,
+        'tax_amount', b.tax_amount,
+        'total_amount', b.total_amount,
+        'status', b.status,
+        'currency', b.currency,
+        'created_at', b.created_at,
+        'items', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', i.id,
+                'description', i.description,
+                'quantity', i.quantity,
+                'unit_price', i.unit_price,
+                'line_total', i.line_total
+            ) ORDER BY i.id)
+            FROM billing.bill_items i WHERE i.bill_id = b.id
+        ), '[]'),
+        'payments', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', p.id,
+                'gateway', p.gateway,
+                'gateway_transaction_id', p.gateway_transaction_id,
+                'amount', p.amount,
+                'status', p.status,
+                'platform_commission_amount', p.platform_commission_amount,
+                'net_settlement_to_facility', p.net_settlement_to_facility
+            ) ORDER BY p.id)
+            FROM billing.payments p WHERE p.bill_id = b.id
+        ), '[]')
+    )::text
+    FROM billing.bills b
+    WHERE b.id = :bill_id
+      AND b.tenant_id = :tenant_id
+      AND (NOT :facility_scoped OR b.facility_id = CAST(:facility_id AS uuid))
+      AND (NOT :patient_scoped OR EXISTS (
+          SELECT 1 FROM app.patients pt
+          WHERE pt.id = b.patient_id AND pt.user_id = CAST(:user_id AS uuid)
+      ))
+""")
+
+def bill_access_params(identity):
+    """Bind params limiting GET_BILL_SQL to bills the caller may read
+
+    Every role is confined to its tenant; facility staff to their facility and
+    patients to their own bills. A scoped role with no facility sees nothing.
+    """
+    role = identity["role"]
+    return {
+        "tenant_id": identity["tenant_id"],
+        "facility_scoped": role in FACILITY_SCOPED_ROLES,
+        "facility_id": identity["facility_id"],
+        "patient_scoped": role == UserRole.PATIENT.value,
+        "user_id": identity["user_id"],
+    }
+
+@billing_bp.route('/bills/<int:bill_id>', methods=['GET'])
+@tenant_scoped
+def get_bill(bill_id):
+    """Get a bill with its items and payments (404 for bills outside the caller's scope)"""
+    try:
+        params = bill_access_params(current_identity())
+        body = db.session.execute(GET_BILL_SQL, {"bill_id": bill_id, **params}).scalar()
+        if body is None:
+            return static_response(NOT_FOUND_BODY, 404)
+        return current_app.response_class(body, status=200, mimetype='application/json')
+        
+    except Exception as e:
+        logger.error(f"Get bill failed: {e}")
+        return jsonify({
+            "error": "Failed to get bill",
+            "message": str(e)
+        }), 500
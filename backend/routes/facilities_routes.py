@@ -0,0 +1,51 @@
+"""
+Facility routes
+GET /api/facilities - List the caller's tenant facilities (first 50)
+"""
+
+from flask import Blueprint, current_app, jsonify
+from sqlalchemy import text
+from models import db
+from services.auth_service import current_identity
+from utils.decorators import tenant_scoped
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Create blueprint
+facilities_bp = Blueprint('facilities', __name__, url_prefix='/api/facilities')
+
+# Postgres builds the final JSON document - no ORM hydration or re-serialization.
+# Always filtered by the caller's tenant; idx_facilities_tenant_name serves the
+# stable (name, id) order so the first page doesn't shuffle between requests
+LIST_FACILITIES_SQL = text("""
+    SELECT COALESCE(json_agg(json_build_object(
+        'id', f.id,
+        'name', f.name,
+        'facility_type', f.facility_type,
+        'status', f.status
+    ) ORDER BY f.name, f.id), '[]')::text
+    FROM (
+        SELECT id, name, facility_type, status
+        FROM app.facilities
+        WHERE tenant_id = :tenant_id
+        ORDER BY name, id
+        LIMIT 50
+    ) f
+""")
+
+@facilities_bp.route('', methods=['GET'])
+@tenant_scoped
+def list_facilities():
+    """List the caller's tenant facilities"""
+    try:
+        tenant_id = current_identity()["tenant_id"]
+        body = db.session.execute(LIST_FACILITIES_SQL, {"tenant_id": tenant_id}).scalar()
+        return current_app.response_class(body, status=200, mimetype='application/json')
+        
+    except Exception as e:
+        logger.error(f"List facilities failed: {e}")
+        return jsonify({
+            "error": "Failed to list facilities",
+            "message": str(e)
+        }), 500
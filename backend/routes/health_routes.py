@@ -1,13 +1,14 @@
 """
 Health check routes - Test if API structure works
 GET /api/health - Basic health check
-GET /api/stats - Database statistics
+GET /api/stats - Database statistics (estimated row counts)
 """
 
 from flask import Blueprint, jsonify
 from datetime import datetime
 from sqlalchemy import text, inspect
 from models import db
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,17 +16,30 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 health_bp = Blueprint('health', __name__, url_prefix='/api')
 
+@functools.lru_cache(maxsize=1)
+def get_database_info():
+    """Server version and schema list, read once per process (static while running)"""
+    with db.engine.connect() as conn:
+        version = conn.exec_driver_sql("SELECT version()").scalar()
+        schemas = tuple(inspect(conn).get_schema_names())
+    return version, schemas
+
 @health_bp.route('/health')
 def health():
     """Basic health check"""
     try:
-        # Test database connection
-        result = db.session.execute(text("SELECT version();"))
-        version = result.scalar()
+        # Test database connection: SELECT 1 on the raw DB-API cursor - no Session/Result layer
+        conn = db.engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+        finally:
+            conn.close()
         
-        # Get schema info
-        inspector = inspect(db.engine)
-        schemas = inspector.get_schema_names()
+        # Version/schema info (cached after the first probe)
+        version, schemas = get_database_info()
         
         return jsonify({
             "status": "healthy",
@@ -47,39 +61,58 @@ def health():
             "timestamp": datetime.now().isoformat()
         }), 500
 
+# Response section -> {key: (schema, table)}
+STATS_TABLES = {
+    "app_schema": {
+        "tenants": ("app", "tenants"),
+        "facilities": ("app", "facilities"),
+        "users": ("app", "users"),
+        "patients": ("app", "patients"),
+        "services": ("app", "services"),
+        "staff": ("app", "staff"),
+    },
+    "billing_schema": {
+        "bills": ("billing", "bills"),
+        "payments": ("billing", "payments"),
+        "cash_collections": ("billing", "cash_collections"),
+    },
+    "settlement_schema": {
+        "settlements": ("settlement", "facility_settlements"),
+    },
+}
+
+# Planner row estimates for every table in one catalog lookup (no seqscans).
+# Partitioned parents carry no rows themselves, so their partitions are summed.
+# reltuples is -1 until the first ANALYZE - reported as 0.
+TABLE_ESTIMATES_SQL = text("""
+    SELECT n.nspname, c.relname,
+           (GREATEST(c.reltuples, 0) + COALESCE((
+               SELECT sum(GREATEST(p.reltuples, 0))
+               FROM pg_inherits i JOIN pg_class p ON p.oid = i.inhrelid
+               WHERE i.inhparent = c.oid
+           ), 0))::bigint
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE (n.nspname, c.relname) IN (VALUES %s)
+""" % ", ".join(
+    f"('{schema}', '{table}')"
+    for tables in STATS_TABLES.values() for schema, table in tables.values()
+))
+
 @health_bp.route('/stats')
 def stats():
-    """Get database statistics"""
+    """Get database statistics (row estimates from pg_class)"""
     try:
-        def get_count(schema, table):
-            """Helper to get table count"""
-            try:
-                result = db.session.execute(
-                    text(f"SELECT COUNT(*) FROM {schema}.{table}")
-                )
-                return result.scalar()
-            except:
-                return 0
+        estimates = {
+            (schema, table): rows
+            for schema, table, rows in db.session.execute(TABLE_ESTIMATES_SQL)
+        }
         
         stats_data = {
-            "app_schema": {
-                "tenants": get_count("app", "tenants"),
-                "facilities": get_count("app", "facilities"),
-                "users": get_count("app", "users"),
-                "patients": get_count("app", "patients"),
-                "services": get_count("app", "services"),
-                "staff": get_count("app", "staff"),
-            },
-            "billing_schema": {
-                "bills": get_count("billing", "bills"),
-                "payments": get_count("billing", "payments"),
-                "cash_collections": get_count("billing", "cash_collections"),
-            },
-            "settlement_schema": {
-                "settlements": get_count("settlement", "facility_settlements"),
-            },
-            "timestamp": datetime.now().isoformat()
+            section: {key: estimates.get(name, 0) for key, name in tables.items()}
+            for section, tables in STATS_TABLES.items()
         }
+        stats_data["timestamp"] = datetime.now().isoformat()
         
         return jsonify(stats_data), 200
         
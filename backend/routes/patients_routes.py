@@ -0,0 +1,49 @@
+"""
+Patient routes
+GET /api/patients - List the caller's patients (first 50) with their bills
+"""
+
+from flask import Blueprint, jsonify
+from models import db, list_query, Patient, UserRole
+from services.auth_service import FACILITY_SCOPED_ROLES, current_identity
+from services.billing_service import bills_by_patient
+from utils.decorators import tenant_scoped
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Create blueprint
+patients_bp = Blueprint('patients', __name__, url_prefix='/api/patients')
+
+
+@patients_bp.route('', methods=['GET'])
+@tenant_scoped
+def list_patients():
+    """List patients with their bills - one patients query plus one bills query"""
+    try:
+        identity = current_identity()
+        query = (
+            list_query(Patient)
+            .where(Patient.tenant_id == identity["tenant_id"])
+            .order_by(Patient.full_name, Patient.id)
+            .limit(50)
+        )
+        if identity["role"] in FACILITY_SCOPED_ROLES:
+            query = query.where(Patient.facility_id == identity["facility_id"])
+        elif identity["role"] == UserRole.PATIENT.value:
+            query = query.where(Patient.user_id == identity["user_id"])
+        patients = db.session.execute(query).scalars().all()
+
+        loader = bills_by_patient()
+        loader.prime(patients)
+        return jsonify([
+            {**patient.to_dict(), "bills": [bill.to_dict() for bill in loader.load(patient)]}
+            for patient in patients
+        ]), 200
+        
+    except Exception as e:
+        logger.error(f"List patients failed: {e}")
+        return jsonify({
+            "error": "Failed to list patients",
+            "message": str(e)
+        }), 500
@@ -0,0 +1,37 @@
+"""
+Payment routes
+GET /api/payments/export - Stream the caller's payments as NDJSON
+"""
+
+from flask import Blueprint, Response, stream_with_context
+from models import db, UserRole
+from services.auth_service import current_identity
+from services.billing_service import PAYMENT_EXPORT_COLUMNS, stream_payments
+from utils.decorators import tenant_scoped
+from utils.json_provider import dumps_bytes
+from utils.responses import FORBIDDEN_BODY, static_response
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Create blueprint
+payments_bp = Blueprint('payments', __name__, url_prefix='/api/payments')
+
+
+@payments_bp.route('/export', methods=['GET'])
+@tenant_scoped
+def export_payments():
+    """Stream payments one JSON object per line - memory stays at one cursor batch"""
+    identity = current_identity()
+    if identity["role"] == UserRole.SUPER_ADMIN.value:
+        facility_id = None  # whole tenant
+    elif identity["role"] == UserRole.FACILITY_ADMIN.value and identity["facility_id"]:
+        facility_id = identity["facility_id"]
+    else:
+        return static_response(FORBIDDEN_BODY, 403)
+
+    def rows():
+        for row in stream_payments(db.session, identity["tenant_id"], facility_id):
+            yield dumps_bytes(dict(zip(PAYMENT_EXPORT_COLUMNS, row))) + b"\n"
+
+    return Response(stream_with_context(rows()), mimetype='application/x-ndjson')
@@ -0,0 +1,29 @@
+"""
+Audit service - batched audit log writes
+Core INSERT straight from dicts: no AuditLog instances, no Session flush
+"""
+
+from sqlalchemy import insert
+
+from models import db, AuditLog
+
+AUDIT_INSERT = insert(AuditLog.__table__)
+
+
+def write_audit_records(records, conn=None):
+    """Insert a batch of audit rows (dicts of audit_log columns)
+
+    Runs as one executemany - psycopg 3 pipelines it, no RETURNING is needed.
+    Without `conn` it commits on its own engine connection, independent of the
+    request's Session; pass `conn` (e.g. db.session.connection()) to make the
+    audit rows part of the caller's transaction instead.
+    """
+    records = list(records)
+    if not records:
+        return 0
+    if conn is not None:
+        conn.execute(AUDIT_INSERT, records)
+    else:
+        with db.engine.begin() as own_conn:
+            own_conn.execute(AUDIT_INSERT, records)
+    return len(records)
@@ -0,0 +1,75 @@
+"""
+Auth service - password verification and access tokens
+"""
+
+import functools
+import hashlib
+import os
+import threading
+import uuid
+
+from cachetools import TTLCache
+from flask_jwt_extended import create_access_token, get_jwt, get_jwt_identity
+from werkzeug.security import check_password_hash
+
+from models import UserRole
+
+# Per-process key: cached digests are useless outside this worker's memory
+_DIGEST_KEY = os.urandom(16)
+
+_verified = TTLCache(maxsize=2048, ttl=300)
+_lock = threading.Lock()
+
+# Roles confined to their own facility's records (token 'fid' claim)
+FACILITY_SCOPED_ROLES = frozenset({UserRole.FACILITY_ADMIN.value, UserRole.STAFF.value})
+
+# Tokens carry ids from a small set of tenants/users - parse each string once
+_uuid = functools.lru_cache(maxsize=4096)(uuid.UUID)
+
+
+def _password_digest(password):
+    """Keyed blake2b so the cache never retains plaintext passwords"""
+    return hashlib.blake2b(password.encode(), key=_DIGEST_KEY, digest_size=16).digest()
+
+
+def verify_password(password_hash, password):
+    """check_password_hash with a 5-minute cache of successful checks"""
+    # The stored hash is part of the key: after a password change (new salt
+    # and hash) old entries can never match again and simply age out
+    key = (password_hash, _password_digest(password))
+    with _lock:
+        if key in _verified:
+            return True
+
+    # Failures are never cached - wrong guesses always pay the full pbkdf2 cost
+    if not check_password_hash(password_hash, password):
+        return False
+
+    with _lock:
+        _verified[key] = True
+    return True
+
+
+def issue_access_token(user):
+    """Access token with a compact string subject; tenant/facility/role ride as short claims"""
+    return create_access_token(
+        identity=str(user.id),
+        additional_claims={
+            "tid": str(user.tenant_id) if user.tenant_id else None,
+            "fid": str(user.facility_id) if user.facility_id else None,
+            "r": user.role,
+        }
+    )
+
+
+def current_identity():
+    """Identity of the verified token in the current request (ids as UUIDs)"""
+    claims = get_jwt()
+    tenant_id = claims.get("tid")
+    facility_id = claims.get("fid")
+    return {
+        "user_id": _uuid(get_jwt_identity()),
+        "tenant_id": _uuid(tenant_id) if tenant_id else None,
+        "facility_id": _uuid(facility_id) if facility_id else None,
+        "role": claims.get("r"),
+    }
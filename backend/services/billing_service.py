@@ -0,0 +1,157 @@
+"""
+Billing service - bulk bill item writes, payment exports, batched bill loads
+Large batches go through COPY FROM STDIN instead of one INSERT per row;
+exports stream from a server-side cursor instead of loading ORM objects
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+
+from flask import g
+from psycopg.types.json import Jsonb
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.orm.attributes import set_committed_value
+
+from models import db, Bill, BillItem
+
+# Below this many rows the ORM's batched INSERT is cheaper than setting up a COPY
+COPY_MIN_ROWS = 50
+
+BILL_ITEM_COPY_SQL = (
+    "COPY billing.bill_items (bill_id, service_id, description, quantity, unit_price, line_total, extra_data) "
+    "FROM STDIN WITH (FORMAT BINARY)"
+)
+BILL_ITEM_COPY_TYPES = ["int8", "uuid", "text", "numeric", "numeric", "numeric", "jsonb"]
+
+
+# Mirrors the bill_items server defaults, so both insert paths store the same row
+BILL_ITEM_NUMERIC_DEFAULTS = {"quantity": Decimal("1"), "unit_price": Decimal("0"), "line_total": Decimal("0")}
+
+
+def _bill_item_row(item):
+    """Normalise one item dict: None means 'use the default', numbers go via str()
+
+    Decimal(str(x)) keeps 0.1 as 0.1 instead of widening the binary float.
+    """
+    row = {key: value for key, value in item.items() if value is not None}
+    for column, default in BILL_ITEM_NUMERIC_DEFAULTS.items():
+        value = item.get(column)
+        row[column] = default if value is None else Decimal(str(value))
+    return row
+
+
+def bulk_insert_bill_items(session, items):
+    """Insert bill items (dicts of BillItem columns) on the session's transaction
+
+    Returns the number of rows written. Rows written by COPY are not loaded
+    into the session - re-query if the instances are needed.
+    """
+    items = [_bill_item_row(item) for item in items]
+    if len(items) < COPY_MIN_ROWS:
+        session.add_all(BillItem(**item) for item in items)
+        session.flush()
+        return len(items)
+
+    # Flush pending ORM writes first so the bills these items point at exist
+    session.flush()
+    cursor = session.connection().connection.cursor()
+    try:
+        with cursor.copy(BILL_ITEM_COPY_SQL) as copy:
+            copy.set_types(BILL_ITEM_COPY_TYPES)
+            for item in items:
+                copy.write_row((
+                    item["bill_id"],
+                    item.get("service_id"),
+                    item["description"],
+                    item["quantity"],
+                    item["unit_price"],
+                    item["line_total"],
+                    Jsonb(item.get("extra_data") or {}),
+                ))
+    finally:
+        cursor.close()
+    return len(items)
+
+
+PAYMENT_EXPORT_COLUMNS = (
+    "id", "bill_id", "facility_id", "patient_id", "gateway", "gateway_transaction_id",
+    "amount", "currency", "status", "platform_commission_amount",
+    "net_settlement_to_facility", "created_at",
+)
+PAYMENT_EXPORT_SQL = (
+    f"SELECT {', '.join(PAYMENT_EXPORT_COLUMNS)} FROM billing.payments "
+    "WHERE tenant_id = %(tenant_id)s "
+    "AND (%(facility_id)s::uuid IS NULL OR facility_id = %(facility_id)s::uuid) "
+    "ORDER BY id"
+)
+
+
+def stream_payments(session, tenant_id, facility_id=None, batch=10000):
+    """Yield a tenant's (or one facility's) payments as plain tuples (PAYMENT_EXPORT_COLUMNS order)
+
+    Uses a named (server-side) cursor on the session's own connection and
+    transaction - the one tenant_scoped bound the RLS context on - so memory is
+    capped at one batch of rows however large the export is, and an export
+    holds a single pooled connection. Don't commit the session mid-stream:
+    that would close the cursor.
+    """
+    cursor = session.connection().connection.cursor(name="payments_export")
+    try:
+        cursor.itersize = batch
+        cursor.execute(PAYMENT_EXPORT_SQL, {"tenant_id": tenant_id, "facility_id": facility_id})
+        yield from cursor
+    finally:
+        cursor.close()
+
+
+# Built and cache-keyed once; each flush only binds the (expanding) id list
+BILLS_FOR_PATIENTS = lambda_stmt(
+    lambda: select(Bill)
+    .where(Bill.patient_id.in_(bindparam("patient_ids", expanding=True)))
+    .order_by(Bill.id)
+)
+
+
+class BillsByPatientLoader:
+    """Request-scoped batcher for Patient.bills (DataLoader style)
+
+    Patients are queued with prime(); the first load() fetches bills for every
+    queued patient in one SELECT ... WHERE patient_id IN (...) and fills each
+    primed Patient's bills collection, so a page of K patients costs one bills
+    query instead of K (Patient.bills itself never lazy-loads).
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self._pending = {}
+        self._bills = {}
+
+    def prime(self, patients):
+        """Queue patients whose bills will be needed in this request"""
+        for patient in patients:
+            if patient.id not in self._bills:
+                self._pending[patient.id] = patient
+
+    def load(self, patient):
+        """Bills for one patient, flushing the whole queue on a miss"""
+        if patient.id not in self._bills:
+            self._pending.setdefault(patient.id, patient)
+            self._flush()
+        return self._bills[patient.id]
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        grouped = defaultdict(list)
+        bills = self.session.execute(BILLS_FOR_PATIENTS, {"patient_ids": list(pending)}).scalars()
+        for bill in bills:
+            grouped[bill.patient_id].append(bill)
+        for patient_id, patient in pending.items():
+            self._bills[patient_id] = grouped[patient_id]
+            set_committed_value(patient, "bills", grouped[patient_id])
+
+
+def bills_by_patient():
+    """The current request's BillsByPatientLoader (one per request, on flask.g)"""
+    if "bills_by_patient" not in g:
+        g.bills_by_patient = BillsByPatientLoader(db.session)
+    return g.bills_by_patient
@@ -0,0 +1,157 @@
+"""
+Shared pytest fixtures - Healthcare Platform API
+
+Database tests run against TEST_DATABASE_URL (a throwaway PostgreSQL 16
+database - its schemas are dropped and rebuilt) and are skipped without it.
+"""
+
+import os
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, text
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    # Must win over .env, which app.py loads on import
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+SCHEMAS = ["app", "billing", "settlement", "audit", "analytics"]
+
+
+@contextmanager
+def _count_queries(target):
+    """Collect every SQL statement executed on an engine/connection"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def count_queries():
+    """Query budget guard against N+1 regressions in to_dict() paths
+
+        with count_queries(db.engine) as queries:
+            client.get('/api/facilities', headers=auth)
+        assert len(queries) <= 3
+    """
+    return _count_queries
+
+
+# =====================================================================
+# APPLICATION & DATABASE
+# =====================================================================
+
+@pytest.fixture(scope="session")
+def app():
+    from app import create_app
+    return create_app("testing")
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture(scope="session")
+def database(app):
+    """Fresh schema built by the same migration `flask init-db` runs"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL not set")
+
+    from app import migrate_database
+    from models import db
+
+    with app.app_context():
+        db.session.execute(text(f"DROP SCHEMA IF EXISTS {', '.join(SCHEMAS)} CASCADE"))
+        db.session.commit()
+    assert migrate_database(app), "database migration failed"
+    return db
+
+
+@pytest.fixture
+def db_session(app, database):
+    """App context with every table emptied afterwards"""
+    with app.app_context():
+        yield database.session
+        database.session.rollback()
+        tables = ", ".join(t.fullname for t in database.metadata.sorted_tables)
+        database.session.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+        database.session.commit()
+
+
+# =====================================================================
+# SEED DATA
+# =====================================================================
+
+def make_tenant(session, code, bills=2):
+    """Tenant with one facility, a facility admin, a patient and `bills` bills"""
+    from models import Tenant, Facility, User, Patient, Bill, BillItem, FacilityType, UserRole
+
+    tenant = Tenant(code=code, name=f"Tenant {code}")
+    session.add(tenant)
+    session.flush()
+    facility = Facility(tenant_id=tenant.id, name=f"{code} Clinic", facility_type=FacilityType.CLINIC)
+    session.add(facility)
+    session.flush()
+    admin = User(
+        tenant_id=tenant.id, facility_id=facility.id, email=f"admin@{code.lower()}.test",
+        password_hash="x", role=UserRole.FACILITY_ADMIN,
+    )
+    patient = Patient(tenant_id=tenant.id, facility_id=facility.id, full_name=f"{code} Patient")
+    session.add_all([admin, patient])
+    session.flush()
+
+    bill_ids = []
+    for i in range(bills):
+        bill = Bill(tenant_id=tenant.id, facility_id=facility.id, patient_id=patient.id,
+                    bill_number=f"{code}-{i}")
+        session.add(bill)
+        session.flush()
+        session.add(BillItem(bill_id=bill.id, description="Consultation"))
+        bill_ids.append(bill.id)
+    session.commit()
+
+    return SimpleNamespace(
+        tenant=tenant, facility=facility, admin=admin, patient=patient, bill_ids=bill_ids,
+    )
+
+
+NO_MDR = dict(
+    mdr_percent=0, mdr_amount=0, mdr_gst_percent=0, mdr_gst_amount=0,
+    platform_mdr_percent=0, platform_mdr_amount=0, platform_mdr_gst_percent=0, platform_mdr_gst_amount=0,
+)
+
+
+def make_payment(seed, txn, amount, commission, net):
+    """Captured online payment against the seed's first bill (MDR fields zeroed)"""
+    from models import Payment
+    return Payment(
+        tenant_id=seed.tenant.id, facility_id=seed.facility.id, bill_id=seed.bill_ids[0],
+        patient_id=seed.patient.id, gateway="razorpay", gateway_transaction_id=txn, amount=amount,
+        status="captured", platform_commission_amount=commission, net_settlement_to_facility=net, **NO_MDR,
+    )
+
+
+def auth_headers(user):
+    """Bearer header for a token issued the way /api/auth/login issues it"""
+    from services.auth_service import issue_access_token
+    return {"Authorization": f"Bearer {issue_access_token(user)}"}
+
+
+@pytest.fixture
+def tenant(db_session):
+    return make_tenant(db_session, "ACME")
+
+
+@pytest.fixture
+def other_tenant(db_session):
+    return make_tenant(db_session, "OTHER")
@@ -0,0 +1,98 @@
+"""
+Audit log partitioning tests
+"""
+
+from datetime import datetime, timezone
+
+from flask import Flask
+from sqlalchemy import text
+
+from conftest import TEST_DATABASE_URL
+
+PARTITION_OF_SQL = text("SELECT tableoid::regclass::text FROM audit.audit_log WHERE record_id = :record_id")
+
+
+def test_init_db_creates_audit_partitions(database, db_session):
+    from models import AuditLog, AuditAction, init_db
+
+    # Start from an audit_log without any partitions, as on a fresh database
+    db_session.execute(text("DROP TABLE audit.audit_log CASCADE"))
+    db_session.commit()
+
+    bare = Flask(__name__)
+    bare.config["SQLALCHEMY_DATABASE_URI"] = TEST_DATABASE_URL
+    init_db(bare)
+
+    with bare.app_context():
+        now = datetime.now(timezone.utc)
+        rows = {
+            "past": datetime(2001, 1, 1, tzinfo=timezone.utc),
+            "current": now,
+            "future": datetime(2099, 1, 1, tzinfo=timezone.utc),
+        }
+        database.session.add_all([
+            AuditLog(table_name="bills", record_id=record_id, action=AuditAction.INSERT, performed_at=at)
+            for record_id, at in rows.items()
+        ])
+        database.session.commit()
+
+        partition = {
+            record_id: database.session.execute(PARTITION_OF_SQL, {"record_id": record_id}).scalar()
+            for record_id in rows
+        }
+        database.session.execute(text("TRUNCATE audit.audit_log"))
+        database.session.commit()
+
+    assert partition == {
+        "past": "audit.audit_log_default",
+        "current": f"audit.audit_log_{now:%Y%m}",
+        "future": "audit.audit_log_default",
+    }
+
+
+def _records(count):
+    return [{"table_name": "bills", "record_id": f"batch-{i}", "action": "insert"} for i in range(count)]
+
+
+def _batch_partitions(session):
+    return session.execute(text(
+        "SELECT record_id, tableoid::regclass::text FROM audit.audit_log "
+        "WHERE record_id LIKE 'batch-%' ORDER BY record_id"
+    )).all()
+
+
+def test_write_audit_records_own_connection(db_session):
+    from services.audit_service import write_audit_records
+
+    assert write_audit_records(_records(3)) == 3
+    # performed_at defaults to statement_timestamp(), in the server's TimeZone
+    month = db_session.execute(text("SELECT to_char(statement_timestamp(), 'YYYYMM')")).scalar()
+    assert _batch_partitions(db_session) == [
+        (f"batch-{i}", f"audit.audit_log_{month}") for i in range(3)
+    ]
+    assert write_audit_records([]) == 0
+
+
+def test_write_audit_records_joins_caller_transaction(db_session, tenant):
+    from models import Tenant
+    from services.audit_service import write_audit_records
+
+    db_session.add(Tenant(code="ROLLED", name="Rolled back"))
+    db_session.flush()
+    write_audit_records(_records(2), conn=db_session.connection())
+    assert len(_batch_partitions(db_session)) == 2
+
+    db_session.rollback()
+    assert _batch_partitions(db_session) == []
+    assert db_session.query(Tenant).filter_by(code="ROLLED").first() is None
+
+
+def test_create_admin_writes_audit_row(app, db_session):
+    result = app.test_cli_runner().invoke(args=["create-admin"])
+    assert result.exit_code == 0
+
+    row = db_session.execute(text(
+        "SELECT a.action, a.new_data ->> 'role' FROM audit.audit_log a "
+        "JOIN app.users u ON a.record_id = u.id::text WHERE u.email = 'admin@healthcare.com'"
+    )).one()
+    assert tuple(row) == ("insert", "super_admin")
@@ -0,0 +1,143 @@
+"""
+Auth tests - JWT verification cache and password check cache
+"""
+
+import time
+
+import jwt as pyjwt
+import pytest
+from flask_jwt_extended import create_access_token, decode_token, jwt_required
+
+from werkzeug.security import generate_password_hash
+
+from middleware import auth_middleware
+from services import auth_service
+from middleware.auth_middleware import TOKEN_CACHE_TTL, _verified_token
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth_middleware._cache.clear()
+    yield
+    auth_middleware._cache.clear()
+
+
+class CountingDecoder:
+    def __init__(self, claims):
+        self.claims = claims
+        self.calls = 0
+
+    def __call__(self, token):
+        self.calls += 1
+        return dict(self.claims)
+
+
+def test_cache_hit_skips_verifier():
+    decode = CountingDecoder({"sub": "u1", "exp": time.time() + 3600})
+
+    first = _verified_token("token", decode)
+    first["sub"] = "mutated"  # callers get copies, never the cached dict
+    second = _verified_token("token", decode)
+
+    assert decode.calls == 1
+    assert second["sub"] == "u1"
+
+
+def test_cache_entry_capped_at_token_expiry(monkeypatch):
+    now = time.time()
+    decode = CountingDecoder({"sub": "u1", "exp": now + 5})
+    monkeypatch.setattr(auth_middleware.time, "time", lambda: now)
+    _verified_token("token", decode)
+    assert auth_middleware._cache[auth_middleware._token_key("token")][1] == now + 5
+
+    # Past exp but well inside TOKEN_CACHE_TTL: must go back to the verifier
+    monkeypatch.setattr(auth_middleware.time, "time", lambda: now + 6)
+    assert 6 < TOKEN_CACHE_TTL
+    _verified_token("token", decode)
+    assert decode.calls == 2
+
+
+@pytest.fixture
+def cached_app(monkeypatch):
+    from app import create_app
+
+    monkeypatch.setenv("CACHE_JWT", "1")
+    app = create_app("testing")
+
+    @app.route('/_whoami')
+    @jwt_required()
+    def whoami():
+        return {"ok": True}
+
+    return app
+
+
+def test_tampered_token_rejected_after_cache_hit(cached_app):
+    with cached_app.app_context():
+        token = create_access_token(identity="u1")
+        assert decode_token(token)["sub"] == "u1"  # now cached
+
+        header, payload, signature = token.split(".")
+        tampered = f"{header}.{payload}.{signature[:-4]}AAAA"
+        with pytest.raises(pyjwt.InvalidSignatureError):
+            decode_token(tampered)
+
+
+def test_blocklist_checked_on_cache_hit(cached_app):
+    revoked = set()
+    jwt_manager = cached_app.extensions["flask-jwt-extended"]
+    jwt_manager.token_in_blocklist_loader(lambda header, payload: payload["jti"] in revoked)
+
+    with cached_app.app_context():
+        token = create_access_token(identity="u1")
+        jti = decode_token(token)["jti"]
+    client = cached_app.test_client()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get('/_whoami', headers=headers).status_code == 200
+    revoked.add(jti)
+    assert client.get('/_whoami', headers=headers).status_code == 401
+
+
+# =====================================================================
+# PASSWORD CHECK CACHE
+# =====================================================================
+
+@pytest.fixture
+def hash_checks(monkeypatch):
+    """Count the real pbkdf2 checks behind verify_password"""
+    auth_service._verified.clear()
+    calls = []
+    real_check = auth_service.check_password_hash
+
+    def counting_check(password_hash, password):
+        calls.append(password_hash)
+        return real_check(password_hash, password)
+
+    monkeypatch.setattr(auth_service, "check_password_hash", counting_check)
+    yield calls
+    auth_service._verified.clear()
+
+
+def test_password_cache_hit(hash_checks):
+    stored = generate_password_hash("s3cret")
+    assert auth_service.verify_password(stored, "s3cret")
+    assert auth_service.verify_password(stored, "s3cret")
+    assert len(hash_checks) == 1
+
+
+def test_password_failures_not_cached(hash_checks):
+    stored = generate_password_hash("s3cret")
+    assert not auth_service.verify_password(stored, "guess")
+    assert not auth_service.verify_password(stored, "guess")
+    assert len(hash_checks) == 2
+
+
+def test_password_change_invalidates_cached_success(hash_checks):
+    old_hash = generate_password_hash("s3cret")
+    assert auth_service.verify_password(old_hash, "s3cret")
+
+    new_hash = generate_password_hash("n3w-s3cret")
+    assert not auth_service.verify_password(new_hash, "s3cret")
+    assert auth_service.verify_password(new_hash, "n3w-s3cret")
+    assert hash_checks == [old_hash, new_hash, new_hash]
@@ -0,0 +1,116 @@
+"""
+Billing route tests
+"""
+
+import pytest
+from sqlalchemy import text
+
+from conftest import auth_headers
+from middleware.logging_middleware import ENDPOINT_QUERY_BUDGETS
+from services.billing_service import COPY_MIN_ROWS
+
+
+def test_get_bill_within_query_budget(client, database, tenant, count_queries):
+    headers = auth_headers(tenant.admin)
+    with count_queries(database.engine) as queries:
+        response = client.get(f'/api/billing/bills/{tenant.bill_ids[0]}', headers=headers)
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["bill_number"] == "ACME-0"
+    assert len(body["items"]) == 1
+    assert len(queries) <= ENDPOINT_QUERY_BUDGETS["billing.get_bill"]
+
+
+def test_get_missing_bill_returns_404(client, database, tenant):
+    response = client.get('/api/billing/bills/999999', headers=auth_headers(tenant.admin))
+    assert response.status_code == 404
+    assert response.get_json()["error"] == "Not found"
+
+
+def test_get_bill_of_another_tenant_returns_404(client, tenant, other_tenant):
+    response = client.get(f'/api/billing/bills/{other_tenant.bill_ids[0]}', headers=auth_headers(tenant.admin))
+    assert response.status_code == 404
+
+
+def test_get_bill_is_facility_and_patient_scoped(client, db_session, tenant):
+    from models import Facility, FacilityType, User, UserRole
+
+    annex = Facility(tenant_id=tenant.tenant.id, name="Annex", facility_type=FacilityType.LAB)
+    db_session.add(annex)
+    db_session.flush()
+    annex_staff = User(tenant_id=tenant.tenant.id, facility_id=annex.id, email="staff@annex.test",
+                       password_hash="x", role=UserRole.STAFF)
+    owner = User(tenant_id=tenant.tenant.id, email="owner@acme.test", password_hash="x", role=UserRole.PATIENT)
+    stranger = User(tenant_id=tenant.tenant.id, email="stranger@acme.test", password_hash="x", role=UserRole.PATIENT)
+    db_session.add_all([annex_staff, owner, stranger])
+    db_session.flush()
+    tenant.patient.user_id = owner.id
+    db_session.commit()
+
+    url = f'/api/billing/bills/{tenant.bill_ids[0]}'
+    assert client.get(url, headers=auth_headers(annex_staff)).status_code == 404
+    assert client.get(url, headers=auth_headers(stranger)).status_code == 404
+    assert client.get(url, headers=auth_headers(owner)).status_code == 200
+
+
+def _items(bill_id, count):
+    return [
+        {"bill_id": bill_id, "description": f"Line {i}", "quantity": 2, "unit_price": "12.50",
+         "line_total": "25.00", "extra_data": {"line": i}}
+        for i in range(count)
+    ]
+
+
+def _stored_items(session, bill_id):
+    return session.execute(text(
+        "SELECT description, quantity, line_total, extra_data FROM billing.bill_items "
+        "WHERE bill_id = :bill_id AND description LIKE 'Line %' ORDER BY id"
+    ), {"bill_id": bill_id}).all()
+
+
+def _loose_items(bill_id, count):
+    """Explicit None / float values, as JSON payloads deliver them"""
+    return [
+        {"bill_id": bill_id, "description": f"Line {i}", "quantity": 1.5, "unit_price": None,
+         "line_total": 0.1, "service_id": None, "extra_data": None}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("count", [3, COPY_MIN_ROWS + 10], ids=["orm", "copy"])
+def test_bulk_insert_normalises_none_and_floats(db_session, tenant, count):
+    from decimal import Decimal
+    from services.billing_service import bulk_insert_bill_items
+
+    assert bulk_insert_bill_items(db_session, _loose_items(tenant.bill_ids[0], count)) == count
+    db_session.commit()
+
+    rows = _stored_items(db_session, tenant.bill_ids[0])
+    assert len(rows) == count
+    assert [tuple(row) for row in rows] == [(f"Line {i}", Decimal("1.50"), Decimal("0.10"), {}) for i in range(count)]
+    unit_prices = db_session.execute(text(
+        "SELECT DISTINCT unit_price FROM billing.bill_items WHERE description LIKE 'Line %'"
+    )).scalars().all()
+    assert unit_prices == [Decimal("0.00")]
+
+
+def test_bulk_insert_small_batch_uses_orm(db_session, tenant):
+    from services.billing_service import bulk_insert_bill_items
+
+    assert bulk_insert_bill_items(db_session, _items(tenant.bill_ids[0], 3)) == 3 < COPY_MIN_ROWS
+    db_session.commit()
+    assert len(_stored_items(db_session, tenant.bill_ids[0])) == 3
+
+
+def test_bulk_insert_large_batch_uses_copy(db_session, tenant):
+    from decimal import Decimal
+    from services.billing_service import bulk_insert_bill_items
+
+    count = COPY_MIN_ROWS + 10
+    assert bulk_insert_bill_items(db_session, _items(tenant.bill_ids[1], count)) == count
+    db_session.commit()
+
+    rows = _stored_items(db_session, tenant.bill_ids[1])
+    assert len(rows) == count
+    assert rows[-1] == (f"Line {count - 1}", Decimal("2"), Decimal("25.00"), {"line": count - 1})
@@ -0,0 +1,84 @@
+"""
+PIN digest tests
+"""
+
+import hmac
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from utils import encryption
+from utils.encryption import pin_hmac, verify_pin
+
+
+def test_pin_hmac_is_32_byte_card_scoped_digest():
+    digest = pin_hmac("HC-0001", "1234")
+    assert isinstance(digest, bytes) and len(digest) == 32
+    assert pin_hmac("HC-0001", "1234") == digest
+    assert pin_hmac("HC-0002", "1234") != digest
+
+
+def test_verify_pin_uses_constant_time_compare(monkeypatch):
+    compared = []
+    real_compare = hmac.compare_digest
+
+    def spy(a, b):
+        compared.append((a, b))
+        return real_compare(a, b)
+
+    monkeypatch.setattr(encryption.hmac, "compare_digest", spy)
+    card = SimpleNamespace(card_number="HC-0001", pin_hmac=memoryview(pin_hmac("HC-0001", "1234")))
+
+    assert verify_pin(card, "1234")
+    assert not verify_pin(card, "9999")
+    assert len(compared) == 2
+    assert not verify_pin(None, "1234")
+
+
+def test_production_requires_pin_key(monkeypatch):
+    from app import create_app
+
+    monkeypatch.delenv("PIN_HMAC_KEY", raising=False)
+    with pytest.raises(RuntimeError, match="PIN_HMAC_KEY"):
+        create_app("production")
+
+
+@pytest.mark.parametrize("key", [
+    "your-pin-hmac-key-here", "dev-pin-hmac-key", "x" * 31, "",
+], ids=["env-placeholder", "dev-default", "short", "empty"])
+def test_production_rejects_placeholder_or_short_pin_key(monkeypatch, key):
+    from app import create_app
+
+    monkeypatch.setenv("PIN_HMAC_KEY", key)
+    with pytest.raises(RuntimeError, match="PIN_HMAC_KEY"):
+        create_app("production")
+
+
+def test_production_accepts_real_pin_key(monkeypatch):
+    from app import create_app
+
+    monkeypatch.setenv("PIN_HMAC_KEY", "k" * 32)
+    assert not create_app("production").config["DEBUG"]
+
+
+def test_pin_hmac_unique_index(db_session, tenant):
+    from models import HealthCard
+
+    def card(number, digest):
+        return HealthCard(
+            tenant_id=tenant.tenant.id, facility_id=tenant.facility.id, patient_id=tenant.patient.id,
+            card_number=number, pin_encrypted=b"x", pin_hmac=digest,
+        )
+
+    db_session.add(card("HC-0001", pin_hmac("HC-0001", "1234")))
+    db_session.commit()
+
+    db_session.add(card("HC-0002", pin_hmac("HC-0001", "1234")))
+    with pytest.raises(IntegrityError, match="uq_health_cards_pin_hmac"):
+        db_session.commit()
+    db_session.rollback()
+
+    db_session.add(card("HC-0003", b"short"))
+    with pytest.raises(IntegrityError, match="ck_health_cards_pin_hmac_len"):
+        db_session.commit()
@@ -0,0 +1,29 @@
+"""
+Facility route tests
+"""
+
+from conftest import auth_headers
+from middleware.logging_middleware import ENDPOINT_QUERY_BUDGETS
+
+
+def test_list_facilities_within_query_budget(client, database, tenant, count_queries):
+    headers = auth_headers(tenant.admin)
+    with count_queries(database.engine) as queries:
+        response = client.get('/api/facilities', headers=headers)
+
+    assert response.status_code == 200
+    assert [f["name"] for f in response.get_json()] == ["ACME Clinic"]
+    assert len(queries) <= ENDPOINT_QUERY_BUDGETS["facilities.list_facilities"]
+
+
+def test_list_facilities_is_tenant_scoped_and_ordered(client, db_session, tenant, other_tenant):
+    from models import Facility, FacilityType
+
+    db_session.add(Facility(tenant_id=tenant.tenant.id, name="ACME Annex", facility_type=FacilityType.LAB))
+    db_session.commit()
+
+    response = client.get('/api/facilities', headers=auth_headers(tenant.admin))
+    facilities = response.get_json()
+
+    assert [f["name"] for f in facilities] == ["ACME Annex", "ACME Clinic"]
+    assert set(facilities[0]) == {"id", "name", "facility_type", "status"}
@@ -0,0 +1,18 @@
+"""
+Health / stats route tests
+"""
+
+from middleware.logging_middleware import ENDPOINT_QUERY_BUDGETS
+
+
+def test_stats_within_query_budget(client, database, db_session, count_queries):
+    with count_queries(database.engine) as queries:
+        response = client.get('/api/stats')
+
+    assert response.status_code == 200
+    assert "timestamp" in response.get_json()
+    assert len(queries) <= ENDPOINT_QUERY_BUDGETS["health.stats"]
+
+
+def test_ping(client):
+    assert client.get('/api/ping').get_json()["status"] == "pong"
@@ -0,0 +1,33 @@
+"""
+orjson provider tests
+"""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from utils.json_provider import dumps_bytes
+
+
+def test_decimal_keeps_exact_digits():
+    assert dumps_bytes({"amount": Decimal("1234567890123.10")}) == b'{"amount":1234567890123.10}'
+    assert dumps_bytes([Decimal("0.1"), Decimal("0E-2")]) == b'[0.1,0.00]'
+
+
+def test_negative_decimal():
+    assert dumps_bytes({"refund": Decimal("-49.99")}) == b'{"refund":-49.99}'
+
+
+@pytest.mark.parametrize("value", ["NaN", "sNaN", "Infinity", "-Infinity"])
+def test_non_finite_decimal_rejected(value):
+    with pytest.raises(orjson.JSONEncodeError):
+        dumps_bytes({"amount": Decimal(value)})
+
+
+def test_non_str_keys():
+    key = uuid.UUID("0190c0de-0000-7000-8000-000000000001")
+    payload = {1: "a", key: "b", date(2026, 1, 31): "c"}
+    assert orjson.loads(dumps_bytes(payload)) == {"1": "a", str(key): "b", "2026-01-31": "c"}
@@ -0,0 +1,33 @@
+"""
+Middleware tests - per-request query budget
+"""
+
+import pytest
+from flask import g
+
+from middleware.logging_middleware import (
+    ENDPOINT_QUERY_BUDGETS, QueryBudgetExceeded, parse_query_budgets,
+)
+
+
+def test_parse_query_budgets():
+    assert parse_query_budgets("billing.get_bill=3, health.stats=2") == {
+        "billing.get_bill": 3, "health.stats": 2,
+    }
+    assert parse_query_budgets(None) == {}
+
+
+def test_request_records_query_count(app, db_session):
+    with app.test_client() as client:
+        assert client.get('/api/stats').status_code == 200
+        assert g.query_count <= ENDPOINT_QUERY_BUDGETS["health.stats"]
+
+
+def test_over_budget_request_fails(monkeypatch, database, db_session):
+    from app import create_app
+
+    monkeypatch.setenv("QUERY_BUDGETS", "health.stats=0")
+    app = create_app("testing")
+
+    with pytest.raises(QueryBudgetExceeded, match="health.stats ran 1 statements"):
+        app.test_client().get('/api/stats')
@@ -0,0 +1,88 @@
+"""
+Model tests - expression indexes, paise columns, enum label migration
+"""
+
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, func, select, text
+
+
+def test_service_priority_tolerates_non_integer_values(db_session, tenant):
+    from models import Service
+
+    values = {"int": 3, "str": "7", "word": "high", "float": 2.5, "huge": "99999999999", "none": None}
+    db_session.add_all([
+        Service(tenant_id=tenant.tenant.id, facility_id=tenant.facility.id, code=code, name=code,
+                extra_data={} if value is None else {"priority": value})
+        for code, value in values.items()
+    ])
+    db_session.commit()  # a bare ::int index expression made 'high' fail here
+
+    in_db = dict(db_session.execute(select(Service.code, Service.priority)).all())
+    in_python = {s.code: s.priority for s in db_session.execute(select(Service)).scalars()}
+    expected = {"int": 3, "str": 7, "word": None, "float": None, "huge": None, "none": None}
+    assert in_db == expected
+    assert in_python == expected
+
+
+def test_service_priority_filter_uses_expression_index(db_session, tenant):
+    from models import Service
+
+    query = select(Service.id).where(Service.priority >= 3)
+    db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = "\n".join(db_session.execute(text(
+        "EXPLAIN " + str(query.compile(compile_kwargs={"literal_binds": True}))
+    )).scalars())
+    db_session.rollback()
+    assert "idx_services_extra_priority" in plan
+
+
+def test_paise_columns_store_rounded_amount_as_int(db_session, tenant):
+    from models import Bill
+
+    # Numeric(14, 2) rounds 10.005 to 10.01 before the generated column sees it
+    amounts = {"half": ("10.005", 1001), "paisa": ("0.01", 1), "large": ("123456789012.34", 12345678901234)}
+    bills = {
+        code: Bill(tenant_id=tenant.tenant.id, facility_id=tenant.facility.id, patient_id=tenant.patient.id,
+                   bill_number=f"PAISE-{code}", total_amount=Decimal(amount))
+        for code, (amount, _) in amounts.items()
+    }
+    db_session.add_all(bills.values())
+    db_session.commit()
+
+    assert {code: bill.total_paise for code, bill in bills.items()} == {
+        code: paise for code, (_, paise) in amounts.items()
+    }
+    paise_sum = func.sum(Bill.total_paise)
+    query = select(paise_sum).where(Bill.bill_number.like("PAISE-%"))
+    assert type(db_session.execute(query).scalar_one()) is Decimal  # sum(int8) is numeric
+    total = db_session.execute(query.with_only_columns(paise_sum.cast(BigInteger))).scalar_one()
+    assert type(total) is int
+    assert total == sum(paise for _, paise in amounts.values())
+
+
+LABELS_SQL = text(
+    "SELECT e.enumlabel FROM pg_enum e JOIN pg_type t ON t.oid = e.enumtypid "
+    "WHERE t.typname = :type_name ORDER BY e.enumsortorder"
+)
+
+
+def test_enum_label_migration_renames_legacy_names(db_session):
+    from models import ENUM_LABELS_MIGRATION_SQL, FacilityType
+
+    # Recreate the pre-pg_enum() state: labels spelled as member NAMES
+    for member in FacilityType:
+        db_session.execute(text(
+            f"ALTER TYPE app.facility_type_enum RENAME VALUE '{member.value}' TO '{member.name}'"
+        ))
+    assert db_session.execute(LABELS_SQL, {"type_name": "facility_type_enum"}).scalars().all() == [
+        member.name for member in FacilityType
+    ]
+
+    connection = db_session.connection()
+    connection.exec_driver_sql(ENUM_LABELS_MIGRATION_SQL)
+    connection.exec_driver_sql(ENUM_LABELS_MIGRATION_SQL)  # second run is a no-op
+    labels = db_session.execute(LABELS_SQL, {"type_name": "facility_type_enum"}).scalars().all()
+    db_session.rollback()
+
+    assert labels == [member.value for member in FacilityType]
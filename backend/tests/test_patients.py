@@ -0,0 +1,58 @@
+"""
+Patient route tests - batched bill loading
+"""
+
+from conftest import auth_headers, make_tenant
+from middleware.logging_middleware import ENDPOINT_QUERY_BUDGETS
+
+
+def _add_patients(session, tenant, count):
+    from models import Patient, Bill
+
+    for i in range(count):
+        patient = Patient(tenant_id=tenant.tenant.id, facility_id=tenant.facility.id, full_name=f"Extra {i}")
+        session.add(patient)
+        session.flush()
+        session.add(Bill(tenant_id=tenant.tenant.id, facility_id=tenant.facility.id,
+                         patient_id=patient.id, bill_number=f"EXTRA-{i}"))
+    session.commit()
+
+
+def _bills_statements(queries):
+    return [q for q in queries if "FROM billing.bills" in q]
+
+
+def test_list_patients_loads_bills_in_one_statement(client, database, db_session, tenant, count_queries):
+    _add_patients(db_session, tenant, 4)
+    make_tenant(db_session, "OTHER")
+
+    with count_queries(database.engine) as queries:
+        response = client.get('/api/patients', headers=auth_headers(tenant.admin))
+
+    assert response.status_code == 200
+    patients = response.get_json()
+    assert len(patients) == 5
+    assert {p["tenant_id"] for p in patients} == {str(tenant.tenant.id)}
+    assert sorted(len(p["bills"]) for p in patients) == [1, 1, 1, 1, 2]
+    assert len(_bills_statements(queries)) == 1
+    assert len(queries) <= ENDPOINT_QUERY_BUDGETS["patients.list_patients"]
+
+
+def test_loader_one_statement_for_n_patients(app, database, db_session, tenant, count_queries):
+    from models import Patient, list_query
+    from services.billing_service import bills_by_patient
+
+    _add_patients(db_session, tenant, 9)
+    patients = db_session.execute(list_query(Patient)).scalars().all()
+    assert len(patients) == 10
+
+    with app.test_request_context(), count_queries(database.engine) as queries:
+        loader = bills_by_patient()
+        loader.prime(patients)
+        bills = {patient.id: loader.load(patient) for patient in patients}
+        assert bills_by_patient() is loader
+        # The relationship itself is filled - no raise_on_sql error
+        assert all(patient.bills == bills[patient.id] for patient in patients)
+
+    assert len(queries) == 1
+    assert sum(len(b) for b in bills.values()) == 11
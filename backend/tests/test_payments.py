@@ -0,0 +1,67 @@
+"""
+Payment export tests
+"""
+
+import orjson
+
+from conftest import auth_headers, make_payment
+
+
+def test_export_streams_own_payments_as_ndjson(client, db_session, tenant, other_tenant):
+    from models import User, UserRole
+
+    db_session.add_all([
+        make_payment(tenant, "txn-1", 100, 3, 95),
+        make_payment(tenant, "txn-2", 40, 1, 39),
+        make_payment(other_tenant, "txn-x", 70, 2, 68),
+    ])
+    super_admin = User(tenant_id=tenant.tenant.id, email="root@acme.test", password_hash="x",
+                       role=UserRole.SUPER_ADMIN)
+    db_session.add(super_admin)
+    db_session.commit()
+
+    for user in (tenant.admin, super_admin):
+        response = client.get('/api/payments/export', headers=auth_headers(user))
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        rows = [orjson.loads(line) for line in response.data.splitlines()]
+        assert [r["gateway_transaction_id"] for r in rows] == ["txn-1", "txn-2"]
+        assert rows[0]["amount"] == 100.0
+
+
+def test_export_forbidden_for_staff(client, db_session, tenant):
+    from models import User, UserRole
+
+    staff = User(tenant_id=tenant.tenant.id, facility_id=tenant.facility.id, email="staff@acme.test",
+                 password_hash="x", role=UserRole.STAFF)
+    db_session.add(staff)
+    db_session.commit()
+
+    assert client.get('/api/payments/export', headers=auth_headers(staff)).status_code == 403
+
+
+def test_export_cursor_runs_on_the_rls_bound_connection(app, db_session, tenant):
+    from sqlalchemy import text
+    from models import set_rls_context
+    from services.billing_service import stream_payments
+
+    db_session.add_all([make_payment(tenant, f"txn-{i}", 10, 1, 9) for i in range(3)])
+    db_session.commit()
+
+    with app.test_request_context():
+        set_rls_context(db_session, tenant.tenant.id, tenant.admin.id)
+        checked_out = app.extensions["sqlalchemy"].engine.pool.checkedout()
+        rows = stream_payments(db_session, tenant.tenant.id, batch=1)
+        next(rows)
+
+        # pg_cursors only lists the current backend's cursors: the export cursor
+        # shares the session's connection, which also carries the tenant context
+        cursors, current_tenant = db_session.execute(text(
+            "SELECT (SELECT count(*) FROM pg_cursors WHERE name = 'payments_export'), "
+            "current_setting('app.current_tenant', true)"
+        )).one()
+        assert (cursors, current_tenant) == (1, str(tenant.tenant.id))
+        assert app.extensions["sqlalchemy"].engine.pool.checkedout() == checked_out
+
+        assert len(list(rows)) == 2
+        db_session.rollback()
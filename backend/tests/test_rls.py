@@ -0,0 +1,44 @@
+"""
+RLS session context tests
+"""
+
+from sqlalchemy import text
+
+from conftest import auth_headers
+
+CURRENT_CONTEXT_SQL = text(
+    "SELECT current_setting('app.current_tenant', true), current_setting('app.current_user', true)"
+)
+
+
+def test_rls_context_cleared_after_commit(db_session):
+    from models import set_rls_context
+
+    set_rls_context(db_session, "11111111-1111-1111-1111-111111111111", "22222222-2222-2222-2222-222222222222")
+    assert db_session.execute(CURRENT_CONTEXT_SQL).one() == (
+        "11111111-1111-1111-1111-111111111111", "22222222-2222-2222-2222-222222222222",
+    )
+
+    db_session.commit()
+    # Same pooled connection, new transaction: SET LOCAL values are gone
+    assert db_session.execute(CURRENT_CONTEXT_SQL).one() in {("", ""), (None, None)}
+
+
+def test_tenant_scoped_binds_caller(database, tenant):
+    from app import create_app
+    from utils.decorators import tenant_scoped
+
+    app = create_app("testing")
+
+    @app.route('/_rls')
+    @tenant_scoped
+    def rls_context():
+        tenant_id, user_id = database.session.execute(CURRENT_CONTEXT_SQL).one()
+        return {"tenant_id": tenant_id, "user_id": user_id}
+
+    response = app.test_client().get('/_rls', headers=auth_headers(tenant.admin))
+    assert response.get_json() == {"tenant_id": str(tenant.tenant.id), "user_id": str(tenant.admin.id)}
+
+
+def test_tenant_scoped_requires_token(client, database):
+    assert client.get('/api/facilities').status_code == 401
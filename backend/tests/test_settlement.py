@@ -0,0 +1,80 @@
+"""
+Settlement totals trigger tests
+"""
+
+import threading
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import text
+
+from conftest import make_payment
+
+TOTALS_SQL = text(
+    "SELECT total_collections_amount, total_commission_amount, hospital_share_amount, platform_share_amount "
+    "FROM settlement.facility_settlements WHERE id = :id"
+)
+
+
+def _settlement(tenant):
+    from models import FacilitySettlement
+    return FacilitySettlement(
+        tenant_id=tenant.tenant.id, facility_id=tenant.facility.id, settlement_type="mixed",
+        from_date=date(2026, 1, 1), to_date=date(2026, 1, 31),
+    )
+
+
+def test_platform_share_is_commission_not_gateway_fees(db_session, tenant):
+    from models import CashCollection, SettlementPayment, SettlementCashCollection
+
+    # 100.00 online: 3.00 platform commission, 2.00 gateway MDR, 95.00 to the facility
+    payment = make_payment(tenant, "txn-1", 100, 3, 95)
+    cash = CashCollection(
+        tenant_id=tenant.tenant.id, facility_id=tenant.facility.id, bill_id=tenant.bill_ids[0],
+        patient_id=tenant.patient.id, amount_collected=50, commission_type="fixed",
+        commission_rate=0, commission_amount=5,
+    )
+    settlement = _settlement(tenant)
+    db_session.add_all([payment, cash, settlement])
+    db_session.flush()
+    db_session.add_all([
+        SettlementPayment(settlement_id=settlement.id, payment_id=payment.id),
+        SettlementCashCollection(settlement_id=settlement.id, cash_collection_id=cash.id),
+    ])
+    db_session.commit()
+
+    collected, commission, hospital, platform = db_session.execute(TOTALS_SQL, {"id": settlement.id}).one()
+    assert (collected, commission, hospital, platform) == (
+        Decimal("150.00"), Decimal("8.00"), Decimal("140.00"), Decimal("8.00"),
+    )
+    # The 2.00 MDR belongs to the gateway, not the platform
+    assert collected - hospital - platform == Decimal("2.00")
+
+
+def test_concurrent_links_aggregate_every_payment(db_session, database, tenant):
+    settlement = _settlement(tenant)
+    payments = [make_payment(tenant, "txn-a", 100, 3, 97), make_payment(tenant, "txn-b", 40, 1, 39)]
+    db_session.add_all([settlement, *payments])
+    db_session.commit()
+
+    link = text("INSERT INTO settlement.settlement_payments (settlement_id, payment_id) VALUES (:s, :p)")
+    engine = database.engine
+
+    def link_second():
+        with engine.begin() as conn:
+            conn.execute(link, {"s": settlement.id, "p": payments[1].id})
+
+    second = threading.Thread(target=link_second)
+    with engine.connect() as first:
+        first.execute(link, {"s": settlement.id, "p": payments[0].id})  # holds the settlement row lock
+        second.start()
+        second.join(timeout=0.5)
+        blocked = second.is_alive()
+        first.commit()
+    second.join(timeout=10)
+    assert blocked, "second linker should wait for the settlement row lock"
+
+    collected, commission, hospital, platform = db_session.execute(TOTALS_SQL, {"id": settlement.id}).one()
+    assert (collected, commission, hospital, platform) == (
+        Decimal("140.00"), Decimal("4.00"), Decimal("136.00"), Decimal("4.00"),
+    )
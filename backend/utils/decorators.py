@@ -0,0 +1,25 @@
+"""
+Route decorators
+"""
+
+import functools
+
+from flask_jwt_extended import jwt_required
+
+from models import db, set_rls_context
+from services.auth_service import current_identity
+
+
+def tenant_scoped(fn):
+    """jwt_required() that also binds the caller's tenant/user for RLS
+
+    The values live for the request's transaction only (SET LOCAL), so the
+    view must run its queries before committing.
+    """
+    @functools.wraps(fn)
+    @jwt_required()
+    def wrapper(*args, **kwargs):
+        identity = current_identity()
+        set_rls_context(db.session, identity["tenant_id"], identity["user_id"])
+        return fn(*args, **kwargs)
+    return wrapper
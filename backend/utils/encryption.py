@@ -0,0 +1,42 @@
+"""
+Encryption utilities - keyed PIN digests
+HMAC-SHA256 lets PIN checks be a 32-byte equality instead of decrypt-and-compare
+"""
+
+import functools
+import hashlib
+import hmac
+import os
+
+DEV_PIN_KEY = "dev-pin-hmac-key"
+# Defaults that ship in code and .env; production refuses them (see create_app)
+PLACEHOLDER_PIN_KEYS = frozenset({DEV_PIN_KEY, "your-pin-hmac-key-here"})
+MIN_PIN_KEY_BYTES = 32  # HMAC-SHA256 output size
+
+
+def is_usable_pin_key(key):
+    """True for a real PIN_HMAC_KEY: not a shipped placeholder, at least 32 bytes"""
+    return bool(key) and key not in PLACEHOLDER_PIN_KEYS and len(key.encode()) >= MIN_PIN_KEY_BYTES
+
+
+@functools.lru_cache(maxsize=1)
+def _pin_key():
+    """Read the key once, after load_dotenv has run"""
+    return os.environ.get("PIN_HMAC_KEY", DEV_PIN_KEY).encode()
+
+
+def pin_hmac(card_number, pin):
+    """Deterministic digest of card number + PIN (card-scoped, so equal PINs differ)"""
+    message = f"{card_number}\x00{pin}".encode()
+    return hmac.new(_pin_key(), message, hashlib.sha256).digest()
+
+
+def verify_pin(card, pin):
+    """Constant-time check of a PIN against a loaded HealthCard
+
+    The card is fetched by card_number; the digest is compared here, not in
+    SQL, so uq_health_cards_pin_hmac is a uniqueness constraint, not a lookup path.
+    """
+    if card is None or card.pin_hmac is None:
+        return False
+    return hmac.compare_digest(bytes(card.pin_hmac), pin_hmac(card.card_number, pin))
@@ -0,0 +1,44 @@
+"""
+orjson-backed JSON provider for Flask
+Serializes UUID, datetime and dataclasses natively in C
+Decimal is written as a JSON number literal, never via float
+"""
+
+from decimal import Decimal
+
+import orjson
+from flask.json.provider import JSONProvider
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """Fallback for types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        # NaN/Infinity have no JSON literal - a money value like that is a bug upstream
+        if not obj.is_finite():
+            raise TypeError(f"Non-finite Decimal is not JSON serializable: {obj}")
+        # Exact numeric literal - keeps money precision and skips Decimal -> float
+        return orjson.Fragment(str(obj))
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj):
+    """Serialize straight to bytes (no str round-trip)"""
+    return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+
+
+class OrjsonProvider(JSONProvider):
+    """Drop-in replacement for Flask's DefaultJSONProvider"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype="application/json")
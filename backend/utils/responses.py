@@ -0,0 +1,74 @@
+"""
+Prebuilt JSON response bodies
+Fixed payloads are serialized once at import; views wrap the cached bytes
+"""
+
+from flask import current_app
+
+from utils.json_provider import dumps_bytes
+
+INDEX_BODY = dumps_bytes({
+    "message": "Healthcare Platform API",
+    "version": "1.0.0",
+    "status": "running",
+    "documentation": "/api/docs",
+    "endpoints": {
+        "health": "/api/health",
+        "auth": {
+            "login": "/api/auth/login",
+            "me": "/api/auth/me",
+            "refresh": "/api/auth/refresh"
+        },
+        "facilities": "/api/facilities",
+        "patients": "/api/patients",
+        "billing": "/api/billing",
+        "analytics": "/api/analytics"
+    }
+})
+
+NOT_FOUND_BODY = dumps_bytes({
+    'error': 'Not found',
+    'message': 'The requested resource was not found',
+    'status': 404
+})
+
+FORBIDDEN_BODY = dumps_bytes({
+    'error': 'Forbidden',
+    'message': 'You do not have permission to access this resource',
+    'status': 403
+})
+
+INTERNAL_ERROR_BODY = dumps_bytes({
+    'error': 'Internal server error',
+    'message': 'An unexpected error occurred',
+    'status': 500
+})
+
+BAD_REQUEST_BODY = dumps_bytes({
+    'error': 'Bad request',
+    'message': 'The request was invalid or malformed',
+    'status': 400
+})
+
+TOKEN_EXPIRED_BODY = dumps_bytes({
+    'error': 'Token expired',
+    'message': 'The authentication token has expired',
+    'status': 401
+})
+
+TOKEN_INVALID_BODY = dumps_bytes({
+    'error': 'Invalid token',
+    'message': 'The authentication token is invalid',
+    'status': 401
+})
+
+TOKEN_MISSING_BODY = dumps_bytes({
+    'error': 'Unauthorized',
+    'message': 'Authentication token is missing',
+    'status': 401
+})
+
+
+def static_response(body, status):
+    """Wrap a prebuilt JSON body in a fresh response"""
+    return current_app.response_class(body, status=status, mimetype='application/json')
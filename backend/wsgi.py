@@ -1,4 +1,8 @@
-from app import app
+"""
+WSGI entry point - the one place the production app is built
+Run: gunicorn -c gunicorn.conf.py wsgi:application
+"""
 
-if __name__ == "__main__":
-    app.run()
+from app import create_app
+
+application = create_app('production')